@@ -0,0 +1,60 @@
+"""
+Stable article identity
+Deterministic, content-addressed IDs derived from a canonical form of the
+article URL, so every worker and every restart agrees on the same ID.
+"""
+
+import hashlib
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid",
+    "ocid", "cmpid", "cmp", "ref", "ref_src", "referrer", "src", "smid",
+    "sr_share", "share", "via", "ito", "ns_mchannel", "ns_source", "ns_campaign",
+    "ns_linkname", "ns_fee", "taid", "__twitter_impression",
+}
+TRACKING_PREFIXES = ("utm_", "at_", "pk_", "mtm_")
+
+ID_DIGEST_SIZE = 8  # bytes -> 16 hex characters
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL so syndicated/tracked variants of a link compare equal
+
+    Lowercases scheme and host, treats http and https as the same, drops
+    "www.", default ports, fragments, tracking parameters and trailing
+    slashes, and sorts the remaining query parameters.
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme == "http":
+        scheme = "https"
+
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    port = parts.port
+    netloc = host if port in (None, 80, 443) else f"{host}:{port}"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = urlencode(sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(name)
+    ))
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+def article_id_for(url: str) -> str:
+    """Compact deterministic article ID: truncated blake2b of the canonical URL"""
+    canonical = canonicalize_url(url)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=ID_DIGEST_SIZE).hexdigest()
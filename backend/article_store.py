@@ -0,0 +1,414 @@
+"""
+Persistent article store
+Processed articles are upserted into an embedded SQLite database so REST
+endpoints can read locally instead of refetching from NewsAPI.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+# Bump when the articles table changes shape; older stores are rebuilt since
+# everything in them can be re-ingested from upstream. upstream_quota is kept:
+# requests already spent against NewsAPI are not undone by re-ingesting
+SCHEMA_VERSION = 3
+
+# Seconds a write waits for another process (e.g. a follower's REST refill)
+# to release the database write lock before failing
+BUSY_TIMEOUT = 10.0
+
+# Payload fields that drift on reprocessing without the article changing
+VOLATILE_FIELDS = {"breaking", "published_ts"}
+
+# Articles published within this many seconds are breaking news
+BREAKING_SECONDS = 3600
+
+# The stored payload with `breaking` recomputed at read time: the stored flag
+# is whatever it was at ingest, and fingerprinting ignores it, so it is never
+# rewritten. Takes the breaking cutoff timestamp as its parameter.
+PAYLOAD_COLUMN = (
+    "json_set(payload, '$.breaking', "
+    "json(CASE WHEN published_ts >= ? THEN 'true' ELSE 'false' END)) AS payload"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    published_ts REAL NOT NULL,
+    source TEXT,
+    bias_level TEXT,
+    verified INTEGER NOT NULL DEFAULT 0,
+    search_text TEXT NOT NULL DEFAULT '',
+    payload TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    ingested_ts REAL NOT NULL
+);
+DROP INDEX IF EXISTS idx_articles_published;
+CREATE INDEX IF NOT EXISTS idx_articles_published_id ON articles (published_ts DESC, id DESC);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_seq ON articles (seq);
+CREATE TABLE IF NOT EXISTS ingest_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS upstream_quota (
+    day TEXT PRIMARY KEY,
+    requests INTEGER NOT NULL
+);
+"""
+
+# Keyset pagination position: (published_ts, id) of the last row served
+PageKey = Tuple[float, str]
+
+def encode_cursor(key: Tuple[float, str]) -> str:
+    """Opaque URL-safe cursor for a (sort value, id) keyset position"""
+    return base64.urlsafe_b64encode(dumps(list(key))).rstrip(b"=").decode()
+
+def decode_cursor(cursor: str) -> Tuple[float, str]:
+    """Inverse of encode_cursor; raises ValueError for malformed cursors"""
+    try:
+        key = loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise ValueError("invalid cursor") from e
+    if (not isinstance(key, list) or len(key) != 2
+            or not isinstance(key[0], (int, float)) or not isinstance(key[1], str)):
+        raise ValueError("invalid cursor")
+    return float(key[0]), key[1]
+
+@lru_cache(maxsize=256)
+def _compile_terms(pattern: str) -> "re.Pattern":
+    return re.compile(pattern, re.IGNORECASE)
+
+def _regexp(pattern: str, value: Optional[str]) -> bool:
+    return value is not None and _compile_terms(pattern).search(value) is not None
+
+def terms_pattern(terms: Iterable[str]) -> str:
+    """Word-boundary alternation matching any of `terms`"""
+    return r"\b(?:" + "|".join(re.escape(t.strip()) for t in terms if t.strip()) + r")\b"
+
+def breaking_cutoff(now: Optional[float] = None) -> float:
+    """Oldest published_ts that still counts as breaking news"""
+    return (now or time.time()) - BREAKING_SECONDS
+
+def payload_fingerprint(payload: Dict[str, Any]) -> str:
+    """Content hash of a serialized article, ignoring VOLATILE_FIELDS"""
+    stable = {k: v for k, v in payload.items() if k not in VOLATILE_FIELDS}
+    encoded = json.dumps(stable, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+class ArticleStore:
+    """SQLite-backed store of processed articles, deduplicated by article ID
+
+    Article IDs are derived from the canonical URL (see article_ids), so
+    tracking-parameter variants of the same link collapse into one row.
+    Every insert or content change is stamped with the next value of a
+    monotonic `seq` column, which doubles as the WebSocket resume cursor.
+
+    All methods are synchronous; async callers should run them through
+    `asyncio.to_thread` so disk I/O never blocks the event loop.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def open(self):
+        if self._conn is not None:
+            return
+        self._conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.create_function("REGEXP", 2, _regexp, deterministic=True)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            if version:
+                logger.info(f"Rebuilding article store (schema v{version} -> v{SCHEMA_VERSION})")
+            self._conn.executescript("DROP TABLE IF EXISTS articles; DROP TABLE IF EXISTS ingest_state;")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.executescript(SCHEMA)
+        logger.info(f"Article store opened at {self.path} ({self.count()} articles)")
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def upsert_many(self, records: Sequence[Dict[str, Any]]) -> Dict[str, int]:
+        """Insert new and changed serialized articles
+
+        Records whose content fingerprint matches the stored row are skipped.
+        Returns {article ID: seq} for the rows that were written.
+        """
+        if not records:
+            return {}
+        now = time.time()
+        ids = [r["id"] for r in records]
+        with self._write():
+            placeholders = ",".join("?" * len(ids))
+            stored = {
+                row["id"]: row["fingerprint"] for row in self._conn.execute(
+                    f"SELECT id, fingerprint FROM articles WHERE id IN ({placeholders})", ids
+                )
+            }
+            seq = self._latest_seq()
+            changes: Dict[str, int] = {}
+            rows = []
+            for record in records:
+                row = self._row(record, now)
+                if stored.get(row["id"]) == row["fingerprint"]:
+                    continue
+                seq += 1
+                row["seq"] = seq
+                stored[row["id"]] = row["fingerprint"]
+                changes[row["id"]] = seq
+                rows.append(row)
+            self._conn.executemany(
+                """
+                INSERT INTO articles (url, id, published_ts, source, bias_level, verified,
+                                      search_text, payload, fingerprint, seq, ingested_ts)
+                VALUES (:url, :id, :published_ts, :source, :bias_level, :verified,
+                        :search_text, :payload, :fingerprint, :seq, :ingested_ts)
+                ON CONFLICT(id) DO UPDATE SET
+                    url = excluded.url,
+                    published_ts = excluded.published_ts,
+                    source = excluded.source,
+                    bias_level = excluded.bias_level,
+                    verified = excluded.verified,
+                    search_text = excluded.search_text,
+                    payload = excluded.payload,
+                    fingerprint = excluded.fingerprint,
+                    seq = excluded.seq
+                """,
+                rows
+            )
+        return changes
+
+    @contextmanager
+    def _write(self):
+        """Write transaction that holds SQLite's write lock from its first statement
+
+        Workers share the database file, so `seq` can only be read from
+        MAX(seq) under BEGIN IMMEDIATE: a second writer then waits for the
+        first to commit instead of reusing its numbers, and seq order matches
+        commit order, which the change-log relay relies on.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.rollback()
+                raise
+            self._conn.commit()
+
+    def _latest_seq(self) -> int:
+        return self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM articles").fetchone()[0]
+
+    def latest_seq(self) -> int:
+        """Sequence number of the most recent insert or change (0 when empty)"""
+        with self._lock:
+            return self._latest_seq()
+
+    @staticmethod
+    def _row(record: Dict[str, Any], now: float) -> Dict[str, Any]:
+        payload = {k: v for k, v in record.items() if k != "published_ts"}
+        return {
+            "url": record["url"],
+            "id": record["id"],
+            "published_ts": record["published_ts"],
+            "source": record.get("source"),
+            "bias_level": record.get("biasLevel"),
+            "verified": int(bool(record.get("verified"))),
+            "search_text": " ".join(
+                record.get(field) or "" for field in ("title", "description", "content")
+            ),
+            "payload": dumps(payload).decode(),
+            "fingerprint": payload_fingerprint(payload),
+            "ingested_ts": now,
+        }
+
+    def query(
+        self,
+        match_all: Sequence[Sequence[str]] = (),
+        bias_level: Optional[str] = None,
+        verified_only: bool = False,
+        limit: int = 50,
+        raw: bool = False
+    ) -> List[Any]:
+        """Newest-first articles matching every term group and filter (see page)"""
+        return self.page(match_all, bias_level, verified_only, limit, raw=raw)[0]
+
+    def page(
+        self,
+        match_all: Sequence[Sequence[str]] = (),
+        bias_level: Optional[str] = None,
+        verified_only: bool = False,
+        limit: int = 50,
+        after: Optional[PageKey] = None,
+        since_ts: Optional[float] = None,
+        until_ts: Optional[float] = None,
+        raw: bool = False
+    ) -> Tuple[List[Any], Optional[PageKey]]:
+        """One newest-first page of articles matching every term group and filter
+
+        Each entry in `match_all` is a group of alternative terms; an article
+        must contain at least one whole-word term from every group. Filters
+        run in SQL before the LIMIT, and `after` resumes strictly below the
+        (published_ts, id) key of the previous page's last row, so every page
+        is an index range scan whatever its depth. `since_ts`/`until_ts`
+        bound publication time on the same index, so a time window costs
+        O(log n + k) rather than a full scan. Returns the rows and the
+        key to continue from, or None on the last page. With raw=True the
+        stored JSON text is returned without decoding. Like get_many and
+        since, rows carry `breaking` as of now rather than as stored.
+        """
+        clauses = []
+        params: List[Any] = []
+        for group in match_all:
+            clauses.append("search_text REGEXP ?")
+            params.append(terms_pattern(group))
+        if bias_level:
+            clauses.append("bias_level = ?")
+            params.append(bias_level)
+        if verified_only:
+            clauses.append("verified = 1")
+        if since_ts is not None:
+            clauses.append("published_ts >= ?")
+            params.append(since_ts)
+        if until_ts is not None:
+            clauses.append("published_ts < ?")
+            params.append(until_ts)
+        if after is not None:
+            clauses.append("(published_ts, id) < (?, ?)")
+            params.extend(after)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(limit + 1)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT published_ts, id, {PAYLOAD_COLUMN} FROM articles {where} "
+                f"ORDER BY published_ts DESC, id DESC LIMIT ?",
+                [breaking_cutoff()] + params
+            ).fetchall()
+        next_key = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_key = (rows[-1]["published_ts"], rows[-1]["id"])
+        decode = (lambda payload: payload) if raw else loads
+        return [decode(row["payload"]) for row in rows], next_key
+
+    def get_many(self, ids: Sequence[str], raw: bool = False) -> List[Any]:
+        """Stored articles for `ids`, in the same order, skipping unknown IDs"""
+        if not ids:
+            return []
+        placeholders = ",".join("?" * len(ids))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, {PAYLOAD_COLUMN} FROM articles WHERE id IN ({placeholders})",
+                [breaking_cutoff()] + list(ids)
+            ).fetchall()
+        payloads = {row["id"]: row["payload"] for row in rows}
+        decode = (lambda payload: payload) if raw else loads
+        return [decode(payloads[i]) for i in ids if i in payloads]
+
+    def recent(self, limit: int = 1000) -> List[Dict[str, Any]]:
+        """Newest stored articles, used to warm in-memory indexes on startup"""
+        return self.query(limit=limit)
+
+    def since(self, cursor: int, limit: int = 100) -> List[Tuple[int, str, str]]:
+        """Articles inserted or changed after `cursor` as (seq, fingerprint, JSON text), oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT seq, fingerprint, {PAYLOAD_COLUMN} FROM articles WHERE seq > ? ORDER BY seq LIMIT ?",
+                (breaking_cutoff(), cursor, limit)
+            ).fetchall()
+        return [(row["seq"], row["fingerprint"], row["payload"]) for row in rows]
+
+    def set_alternate_sources(self, updates: Dict[str, List[Dict[str, str]]]):
+        """Replace the alternateSources list of stored canonical articles"""
+        if not updates:
+            return
+        with self._write():
+            seq = self._latest_seq()
+            for article_id, alternates in updates.items():
+                row = self._conn.execute(
+                    "SELECT payload FROM articles WHERE id = ?", (article_id,)
+                ).fetchone()
+                if row is None:
+                    continue
+                payload = loads(row["payload"])
+                if payload.get("alternateSources") == alternates:
+                    continue
+                payload["alternateSources"] = alternates
+                seq += 1
+                self._conn.execute(
+                    "UPDATE articles SET payload = ?, fingerprint = ?, seq = ? WHERE id = ?",
+                    (dumps(payload).decode(), payload_fingerprint(payload), seq, article_id)
+                )
+
+    def get_state(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM ingest_state WHERE key = ?", (key,)
+            ).fetchone()
+        return row["value"] if row else default
+
+    def set_state(self, key: str, value: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO ingest_state (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value)
+            )
+
+    def quota_usage(self, day: str) -> int:
+        """Upstream requests recorded for a UTC day (YYYY-MM-DD)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT requests FROM upstream_quota WHERE day = ?", (day,)
+            ).fetchone()
+        return row["requests"] if row else 0
+
+    def add_quota_usage(self, day: str, count: int = 1, prune_before: Optional[str] = None) -> int:
+        """Atomically add to a day's upstream request count and return the new total
+
+        Ledger entries for days before `prune_before` are dropped.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO upstream_quota (day, requests) VALUES (?, ?) "
+                "ON CONFLICT(day) DO UPDATE SET requests = requests + excluded.requests",
+                (day, count)
+            )
+            if prune_before:
+                self._conn.execute("DELETE FROM upstream_quota WHERE day < ?", (prune_before,))
+            row = self._conn.execute("SELECT requests FROM upstream_quota WHERE day = ?", (day,)).fetchone()
+        return row["requests"]
+
+    def high_water_mark(self, stream: str) -> float:
+        """Newest publishedAt timestamp already ingested for a poll stream"""
+        return float(self.get_state(f"hwm:{stream}", "0"))
+
+    def set_high_water_mark(self, stream: str, published_ts: float):
+        if published_ts > self.high_water_mark(stream):
+            self.set_state(f"hwm:{stream}", repr(published_ts))
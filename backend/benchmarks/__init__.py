@@ -0,0 +1 @@
+"""Performance benchmarks and local upstream stand-ins"""
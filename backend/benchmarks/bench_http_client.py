@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""
+Upstream client benchmark
+Compares a fresh httpx.AsyncClient per call against the shared pooled client
+used by fetch_news_upstream, both talking to the local NewsAPI stand-in.
+
+Usage: python backend/benchmarks/bench_http_client.py --requests 200 --connect-delay 0.03
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# fetch_news_upstream records quota in the article store and writes a
+# snapshot; keep both out of the real data and lift the rate limits
+os.environ.setdefault("ARTICLE_STORE_PATH", os.path.join(tempfile.mkdtemp(prefix="news-intel-bench-"), "articles.db"))
+os.environ.setdefault("NEWSAPI_DAILY_QUOTA", "10000000")
+os.environ.setdefault("UPSTREAM_BURST", "100000")
+os.environ.setdefault("UPSTREAM_REQUESTS_PER_MINUTE", "1000000")
+
+import httpx  # noqa: E402
+
+import main  # noqa: E402
+from benchmarks.fake_newsapi import FakeNewsAPI  # noqa: E402
+
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+def summarize(name: str, samples: List[float]) -> dict:
+    ordered = sorted(samples)
+    result = {
+        "name": name,
+        "requests": len(ordered),
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[int(len(ordered) * 0.95) - 1] * 1000,
+        "mean_ms": statistics.fmean(ordered) * 1000,
+    }
+    print(f"{name:<24} p50={result['p50_ms']:7.2f}ms  p95={result['p95_ms']:7.2f}ms  mean={result['mean_ms']:7.2f}ms")
+    return result
+
+async def fresh_client_call(base_url: str):
+    """Previous behaviour: new client (and connection) for every call"""
+    async with httpx.AsyncClient() as client:
+        response = await client.get(f"{base_url}/everything", params={"q": "politics", "pageSize": 100})
+        response.raise_for_status()
+        return response.json()["articles"]
+
+async def timed_calls(factory, count: int, concurrency: int) -> List[float]:
+    samples: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            await factory()
+            samples.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(one() for _ in range(count)))
+    return samples
+
+async def run(args):
+    upstream = await FakeNewsAPI(corpus_size=100, latency=args.latency, connect_delay=args.connect_delay).start()
+    main.NEWS_API_URL = upstream.base_url
+    print(f"Stub upstream at {upstream.base_url} (connect delay {args.connect_delay * 1000:.0f}ms)")
+
+    upstream.connections = 0
+    fresh = await timed_calls(lambda: fresh_client_call(upstream.base_url), args.requests, args.concurrency)
+    fresh_connections = upstream.connections
+
+    await asyncio.to_thread(main.article_store.open)
+    main.http_client = main.create_http_client()
+    upstream.connections = 0
+    pooled = await timed_calls(lambda: main.fetch_news_upstream(query="politics"), args.requests, args.concurrency)
+    pooled_connections = upstream.connections
+    await main.http_client.aclose()
+    await asyncio.to_thread(main.article_store.close)
+
+    await upstream.stop()
+
+    print()
+    summarize("client per call", fresh)
+    summarize("shared pooled client", pooled)
+    print(f"\nTCP connections opened: per-call={fresh_connections}  pooled={pooled_connections}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.005, help="Stub per-request latency (s)")
+    parser.add_argument("--connect-delay", type=float, default=0.03, help="Stub per-connection setup cost (s)")
+    asyncio.run(run(parser.parse_args()))
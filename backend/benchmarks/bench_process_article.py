@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""
+Article processing micro-benchmark
+Times the analyzers (analyze_text: bias, sentiment and topics in one
+pass), process_article and a process_article_chunk batch over a synthetic
+corpus, reporting us/article and articles/s (best of --repeat passes).
+
+Usage: python backend/benchmarks/bench_process_article.py --articles 2000 --json process.json
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+from benchmarks.fake_newsapi import build_corpus  # noqa: E402
+from benchmarks.results import write_results  # noqa: E402
+
+def best_of(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def per_article(seconds: float, count: int) -> Dict[str, float]:
+    return {"per_article_us": round(seconds / count * 1e6, 3), "articles_per_s": round(count / seconds, 1)}
+
+def run(articles: int = 2000, repeat: int = 5) -> Dict[str, Any]:
+    corpus = build_corpus(articles, distinct=True)
+    texts: List[str] = [f"{a['title']} {a['description']} {a['content']}" for a in corpus]
+    cases = {
+        "analyze_text": lambda: [main.analyze_text(text) for text in texts],
+        "process_article": lambda: [main.process_article(article) for article in corpus],
+        "process_article_chunk": lambda: main.process_article_chunk(corpus),
+    }
+    results = {"articles": articles}
+    for name, fn in cases.items():
+        results[name] = per_article(best_of(fn, repeat), articles)
+    return results
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--articles", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    results = run(args.articles, args.repeat)
+    print(f"{args.articles} articles, best of {args.repeat}")
+    print(f"{'stage':<24} {'us/article':>12} {'articles/s':>12}")
+    for name, value in results.items():
+        if isinstance(value, dict):
+            print(f"{name:<24} {value['per_article_us']:>12.2f} {value['articles_per_s']:>12.0f}")
+    if args.json:
+        write_results(args.json, {"process_article": results})
+
+if __name__ == "__main__":
+    main_cli()
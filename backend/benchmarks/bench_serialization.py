@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""
+Response serialization benchmark
+Times building a /api/v1/news/politics body from processed articles the old
+way (.dict() + jsonable_encoder + stdlib json), with a single model_dump
+pass, with orjson, and by splicing the pre-serialized payloads kept in the
+article store, reporting responses/s and MB/s for each.
+
+Usage: python backend/benchmarks/bench_serialization.py --articles 100 --repeat 200
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+import main  # noqa: E402
+import serialization  # noqa: E402
+from benchmarks.fake_newsapi import build_corpus  # noqa: E402
+
+def legacy(articles, stored):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        body = {"articles": [a.dict() for a in articles], "total": len(articles)}
+    return json.dumps(jsonable_encoder(body)).encode()
+
+def model_dump_stdlib(articles, stored):
+    body = {"articles": [a.model_dump(mode="json") for a in articles], "total": len(articles)}
+    return json.dumps(body, separators=(",", ":")).encode()
+
+def model_dump_orjson(articles, stored):
+    body = {"articles": [a.model_dump() for a in articles], "total": len(articles)}
+    return serialization.orjson.dumps(body)
+
+def spliced(articles, stored):
+    return serialization.dumps({"articles": serialization.raw_list(stored), "total": len(stored)})
+
+def bench(fn, articles, stored, repeat: int):
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = len(fn(articles, stored))
+        best = min(best, time.perf_counter() - start)
+    return best, size
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--articles", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    articles = main.process_article_chunk(build_corpus(args.articles))
+    stored = [serialization.dumps(a.model_dump(mode="json")).decode() for a in articles]
+
+    cases = [("dict + jsonable_encoder + json", legacy), ("model_dump + json", model_dump_stdlib)]
+    if serialization.orjson is not None:
+        cases.append(("model_dump + orjson", model_dump_orjson))
+    cases.append((f"pre-serialized splice ({'orjson' if serialization.orjson else 'stdlib'})", spliced))
+
+    print(f"{args.articles} articles per response, best of {args.repeat}")
+    print(f"{'path':<36} {'ms/response':>12} {'responses/s':>12} {'MB/s':>8} {'speedup':>8}")
+    baseline = None
+    for name, fn in cases:
+        seconds, size = bench(fn, articles, stored, args.repeat)
+        baseline = baseline or seconds
+        print(f"{name:<36} {seconds * 1000:>12.3f} {1 / seconds:>12.0f} {size / seconds / 1e6:>8.1f} "
+              f"{baseline / seconds:>7.1f}x")
+
+if __name__ == "__main__":
+    main_cli()
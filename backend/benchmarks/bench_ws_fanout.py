@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+WebSocket fan-out load test
+Measures ConnectionManager broadcast/publish cost against in-memory sockets
+as the number of subscribers grows, comparing the firehose with channel
+routing where only a fraction of clients match each article.
+
+Usage: python backend/benchmarks/bench_ws_fanout.py --clients 1000 10000 20000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from broadcast import ConnectionManager  # noqa: E402
+
+TOPICS = ["election", "parliament", "diplomacy", "policy", "congress",
+          "government", "president", "legislation", "politics", "prime minister"]
+
+class NullWebSocket:
+    """Stands in for a Starlette WebSocket; optionally slow to send"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.received = 0
+        self.bytes = 0
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.received += 1
+        self.bytes += len(text)
+
+    async def close(self, code: int = 1000):
+        pass
+
+ARTICLE = {
+    "type": "new_article",
+    "article": {
+        "id": "0123456789abcdef",
+        "title": "EU Parliament passes landmark digital policy legislation",
+        "description": "Lawmakers approved the package after months of negotiation." * 3,
+        "source": "Reuters",
+        "topics": ["parliament", "legislation"],
+        "biasLevel": "low",
+    },
+}
+
+async def run_case(clients: int, routed: bool, messages: int, slow_fraction: float) -> dict:
+    manager = ConnectionManager(queue_size=messages + 1)
+    sockets = []
+    for i in range(clients):
+        ws = NullWebSocket(delay=0.05 if i < clients * slow_fraction else 0.0)
+        await manager.connect(ws)
+        if routed:
+            # Each client follows one topic, so one article matches ~2/10 of them
+            manager.subscribe(ws, f"topic:{TOPICS[i % len(TOPICS)]}")
+        sockets.append(ws)
+
+    channels = [f"topic:{t}" for t in ARTICLE["article"]["topics"]]
+    start = time.perf_counter()
+    for _ in range(messages):
+        await manager.publish(ARTICLE, channels)
+    enqueue = time.perf_counter() - start
+
+    fast = [ws for ws in sockets if not ws.delay]
+    expected = sum(1 for ws in fast if not routed or any(
+        c in manager.active_connections[ws].channels for c in channels
+    )) * messages
+    while sum(ws.received for ws in fast) < expected:
+        await asyncio.sleep(0.001)
+    delivered = time.perf_counter() - start
+
+    sent_bytes = sum(ws.bytes for ws in sockets)
+    await manager.close_all()
+    return {
+        "clients": clients,
+        "mode": "channels" if routed else "firehose",
+        "publish_us": enqueue / messages * 1e6,
+        "delivery_ms": delivered * 1000,
+        "messages_sent": sum(ws.received for ws in sockets),
+        "mb_sent": sent_bytes / 1e6,
+    }
+
+async def main(args):
+    print(f"{'clients':>8} {'mode':>9} {'publish us/msg':>15} {'all fast delivered ms':>22} {'sent':>9} {'MB':>7}")
+    for clients in args.clients:
+        for routed in (False, True):
+            r = await run_case(clients, routed, args.messages, args.slow_fraction)
+            print(f"{r['clients']:>8} {r['mode']:>9} {r['publish_us']:>15.1f} {r['delivery_ms']:>22.1f} "
+                  f"{r['messages_sent']:>9} {r['mb_sent']:>7.2f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, nargs="+", default=[1000, 5000, 10000])
+    parser.add_argument("--messages", type=int, default=5)
+    parser.add_argument("--slow-fraction", type=float, default=0.01,
+                        help="Fraction of clients with a 50ms send delay")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,175 @@
+"""
+Local NewsAPI stand-in for benchmarks
+Serves /v2/everything and /v2/top-headlines over plain HTTP/1.1 with keep-alive,
+with configurable latency, corpus size and injected error rate
+"""
+
+import asyncio
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+SAMPLE_SOURCES = ["Reuters", "BBC News", "Politico", "CNN", "Financial Times", "Al Jazeera English"]
+
+SAMPLE_HEADLINES = [
+    "G20 leaders reach agreement on climate finance",
+    "UN Security Council debates sanctions in emergency session",
+    "EU Parliament passes landmark digital policy legislation",
+    "NATO summit focuses on defense cooperation",
+    "Election tension rises as parliament dissolves",
+    "Trade agreement talks show progress despite dispute",
+]
+
+# Vocabulary for distinct synthetic stories (load tests need articles that
+# story clustering does not collapse into the six sample headlines)
+STORY_WORDS = """
+senate ballot coalition tariff treaty minister budget reform border veto referendum
+cabinet embassy census subsidy mandate governor caucus summit sanctions ceasefire
+pension inflation pipeline lobbying tribunal amendment filibuster envoy militia
+harbor drought vaccine railway refinery festival uprising pardon audit quarry
+""".split()
+
+def build_corpus(size: int = 100, distinct: bool = False) -> List[Dict]:
+    """Build a deterministic list of NewsAPI-shaped articles
+
+    With `distinct`, every article gets its own generated headline instead of
+    cycling through SAMPLE_HEADLINES, so each one is stored separately.
+    """
+    now = datetime.now(timezone.utc)
+    articles = []
+    for i in range(size):
+        headline = SAMPLE_HEADLINES[i % len(SAMPLE_HEADLINES)]
+        if distinct:
+            words = random.Random(i).sample(STORY_WORDS, 8)
+            headline = f"{' '.join(words[:5]).capitalize()} in {words[5]} politics"
+        articles.append({
+            "source": {"id": None, "name": SAMPLE_SOURCES[i % len(SAMPLE_SOURCES)]},
+            "author": f"Reporter {i % 17}",
+            "title": f"{headline} ({i})",
+            "description": f"{headline}. Officials describe the government response as a shocking turn.",
+            "url": f"https://news.example.com/story/{i}",
+            "urlToImage": None,
+            "publishedAt": (now - timedelta(minutes=i)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "content": f"{headline}. The president and prime minister discussed policy and diplomacy. [+{i} chars]",
+        })
+    return articles
+
+REASONS = {200: "OK", 429: "Too Many Requests", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+class FakeNewsAPI:
+    """Minimal asyncio HTTP server that mimics NewsAPI responses
+
+    `connect_delay` is charged once per new TCP connection to model the
+    DNS/TCP/TLS setup cost of talking to the real upstream, while `latency`
+    is charged on every request. A random `error_rate` fraction of requests
+    is answered with `error_status` (429s carry a Retry-After of
+    `retry_after` seconds); `seed` makes the sequence reproducible.
+    """
+
+    def __init__(self, corpus_size: int = 100, latency: float = 0.0, connect_delay: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 500, retry_after: int = 1,
+                 seed: Optional[int] = None, distinct: bool = False):
+        self.corpus = build_corpus(corpus_size, distinct)
+        self.latency = latency
+        self.connect_delay = connect_delay
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.connections = 0
+        self.requests = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/v2"
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> "FakeNewsAPI":
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def render(self, path: str, params: Dict[str, List[str]]) -> Tuple[int, Dict]:
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.errors += 1
+            return self.error_status, {"status": "error", "code": "injectedFailure", "message": "Injected failure"}
+        page_size = int(params.get("pageSize", ["100"])[0])
+        page = int(params.get("page", ["1"])[0])
+        start = (page - 1) * page_size
+        articles = self.corpus[start:start + page_size]
+        return 200, {"status": "ok", "totalResults": len(self.corpus), "articles": articles}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        if self.connect_delay:
+            await asyncio.sleep(self.connect_delay)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                if int(headers.get("content-length", "0")):
+                    await reader.readexactly(int(headers["content-length"]))
+
+                self.requests += 1
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+
+                target = request_line.decode("latin-1").split(" ")[1]
+                parts = urlsplit(target)
+                status, payload = self.render(parts.path, parse_qs(parts.query))
+                body = json.dumps(payload).encode()
+                retry_after = f"Retry-After: {self.retry_after}\r\n" if status == 429 else ""
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, 'Error')}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"{retry_after}"
+                    f"Connection: keep-alive\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+async def _serve_forever(port: int, latency: float, connect_delay: float, corpus_size: int,
+                         error_rate: float, error_status: int, seed: Optional[int]):
+    server = await FakeNewsAPI(
+        corpus_size, latency, connect_delay, error_rate=error_rate, error_status=error_status, seed=seed
+    ).start(port=port)
+    print(f"Fake NewsAPI listening on {server.base_url}")
+    await asyncio.Event().wait()
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a local NewsAPI stand-in")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency", type=float, default=0.0, help="Per-request delay in seconds")
+    parser.add_argument("--connect-delay", type=float, default=0.0, help="Per-connection setup delay in seconds")
+    parser.add_argument("--corpus-size", type=int, default=100)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests that fail")
+    parser.add_argument("--error-status", type=int, default=500, help="Status of injected failures (e.g. 429, 503)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    asyncio.run(_serve_forever(args.port, args.latency, args.connect_delay, args.corpus_size,
+                               args.error_rate, args.error_status, args.seed))
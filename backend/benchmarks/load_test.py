@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+"""
+HTTP and WebSocket load test
+Starts the fake NewsAPI and a uvicorn server on a throwaway article store,
+then drives /api/v1/news/politics and /api/v1/news/search with closed-loop
+concurrent clients and measures /ws fan-out to many subscribers, reporting
+req/s and p50/p95/p99 latencies as JSON.
+
+Usage: python backend/benchmarks/load_test.py --duration 10 --concurrency 20 --ws-clients 200 --json load.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from typing import Any, Callable, Dict, List
+
+import httpx
+import websockets
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from benchmarks.fake_newsapi import STORY_WORDS, FakeNewsAPI  # noqa: E402
+from benchmarks.multi_worker import breaking_article  # noqa: E402
+from benchmarks.results import latency_summary, write_results  # noqa: E402
+
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+def server_env(fake: FakeNewsAPI, workdir: str, poll_interval: float) -> Dict[str, str]:
+    """Server settings: throwaway store, the fake upstream, no quota pressure"""
+    return dict(
+        os.environ,
+        NEWS_API_URL=fake.base_url,
+        ARTICLE_STORE_PATH=os.path.join(workdir, "articles.db"),
+        WORKER_LOCK_PATH=os.path.join(workdir, "leader.lock"),
+        WORKER_SOCKET_PATH=os.path.join(workdir, "leader.sock"),
+        NEWSAPI_DAILY_QUOTA="10000000",
+        UPSTREAM_BURST="100000",
+        UPSTREAM_REQUESTS_PER_MINUTE="1000000",
+        POLL_MIN_INTERVAL=str(poll_interval),
+        POLL_MAX_INTERVAL=str(poll_interval),
+    )
+
+async def wait_ready(client: httpx.AsyncClient, url: str, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get(f"{url}/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+async def closed_loop(client: httpx.AsyncClient, make_request: Callable[[random.Random], Any],
+                      concurrency: int, duration: float) -> Dict[str, Any]:
+    """`concurrency` clients each issuing requests back to back for `duration` seconds"""
+    samples: List[float] = []
+    errors = 0
+    deadline = time.monotonic() + duration
+
+    async def worker(seed: int):
+        nonlocal errors
+        rng = random.Random(seed)
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                response = await make_request(rng)
+                ok = response.status_code in (200, 304)
+            except httpx.HTTPError:
+                ok = False
+            if ok:
+                samples.append(time.perf_counter() - start)
+            else:
+                errors += 1
+
+    started = time.monotonic()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return latency_summary(samples, time.monotonic() - started, errors)
+
+def politics_request(client: httpx.AsyncClient, url: str):
+    def make(rng: random.Random):
+        params = {
+            "limit": rng.choice([20, 50, 100]),
+            "timeRange": rng.choice(["24h", "7d", "all"]),
+            "biasLevel": rng.choice(["all", "all", "low", "medium", "high"]),
+        }
+        return client.get(f"{url}/api/v1/news/politics", params=params)
+    return make
+
+def search_request(client: httpx.AsyncClient, url: str):
+    def make(rng: random.Random):
+        q = " ".join(rng.sample(STORY_WORDS, 2))
+        return client.get(f"{url}/api/v1/news/search", params={"q": q, "limit": 20})
+    return make
+
+async def ws_fanout(url: str, clients: int, batches: int, batch_size: int, fake: FakeNewsAPI,
+                    poll_interval: float) -> Dict[str, Any]:
+    """Inject articles upstream and time their delivery to every WebSocket subscriber
+
+    Fan-out lag is each delivery's delay after the first client received the
+    same article; end-to-end latency also includes the poll interval.
+    """
+    arrivals: Dict[str, List[float]] = defaultdict(list)
+    ready = asyncio.Event()
+    connected = 0
+
+    async def subscriber():
+        nonlocal connected
+        async with websockets.connect(f"{url.replace('http', 'ws', 1)}/ws", max_queue=None) as ws:
+            connected += 1
+            if connected == clients:
+                ready.set()
+            async for raw in ws:
+                now = time.perf_counter()
+                message = json.loads(raw)
+                if message.get("type") == "new_article":
+                    arrivals[message["article"]["url"]].append(now)
+
+    tasks = [asyncio.create_task(subscriber()) for _ in range(clients)]
+    try:
+        await asyncio.wait_for(ready.wait(), timeout=60)
+        injected: Dict[str, float] = {}
+        for _ in range(batches):
+            batch = [breaking_article(uuid.uuid4().hex) for _ in range(batch_size)]
+            for article in batch:
+                injected[article["url"]] = time.perf_counter()
+            fake.corpus[:0] = batch
+            await asyncio.sleep(poll_interval * 1.5)
+
+        deadline = time.monotonic() + poll_interval * 5
+        expected = len(injected) * clients
+        while sum(len(arrivals[u]) for u in injected) < expected and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    fanout = [t - min(times) for u in injected for times in [arrivals[u]] if times for t in times]
+    end_to_end = [t - injected[u] for u in injected for t in arrivals[u]]
+    delivered = sum(len(arrivals[u]) for u in injected)
+    result = {
+        "clients": clients,
+        "articles": len(injected),
+        "expected_deliveries": len(injected) * clients,
+        "delivered": delivered,
+        "fanout_lag": latency_summary(fanout),
+        "end_to_end": latency_summary(end_to_end),
+    }
+    span = max((max(t) - min(t) for u in injected for t in [arrivals[u]] if t), default=0)
+    if span:
+        result["fanout_deliveries_per_s"] = round(clients / span, 1)
+    return result
+
+async def run(duration: float = 10.0, concurrency: int = 20, ws_clients: int = 200, corpus_size: int = 500,
+              latency: float = 0.05, error_rate: float = 0.0, poll_interval: float = 2.0,
+              ws_batches: int = 3, ws_batch_size: int = 5, port: int = 8200, seed: int = 1) -> Dict[str, Any]:
+    fake = await FakeNewsAPI(
+        corpus_size=corpus_size, latency=latency, error_rate=error_rate, seed=seed, distinct=True
+    ).start()
+    workdir = tempfile.mkdtemp(prefix="news-intel-load-")
+    url = f"http://127.0.0.1:{port}"
+    server_log = open(os.path.join(workdir, "server.log"), "w")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=server_env(fake, workdir, poll_interval),
+        stdout=server_log, stderr=subprocess.STDOUT,
+    )
+    results: Dict[str, Any] = {
+        "config": {
+            "duration_s": duration, "concurrency": concurrency, "corpus_size": corpus_size,
+            "upstream_latency_s": latency, "upstream_error_rate": error_rate,
+        },
+        "server_log": server_log.name,
+    }
+    try:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+            await wait_ready(client, url)
+            # Let the first poll fill the store, then warm the read paths
+            await asyncio.sleep(poll_interval)
+            await client.get(f"{url}/api/v1/news/politics", params={"limit": 100})
+
+            results["politics"] = await closed_loop(client, politics_request(client, url), concurrency, duration)
+            results["search"] = await closed_loop(client, search_request(client, url), concurrency, duration)
+        if ws_clients:
+            results["ws_fanout"] = await ws_fanout(url, ws_clients, ws_batches, ws_batch_size, fake, poll_interval)
+        results["upstream_requests"] = fake.requests
+        results["upstream_errors"] = fake.errors
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+        server_log.close()
+        await fake.stop()
+    return results
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per HTTP scenario")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--ws-clients", type=int, default=200, help="0 skips the WebSocket scenario")
+    parser.add_argument("--ws-batches", type=int, default=3)
+    parser.add_argument("--corpus-size", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake upstream latency (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fake upstream failure fraction")
+    parser.add_argument("--poll-interval", type=float, default=2.0)
+    parser.add_argument("--port", type=int, default=8200)
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(
+        duration=args.duration, concurrency=args.concurrency, ws_clients=args.ws_clients,
+        corpus_size=args.corpus_size, latency=args.latency, error_rate=args.error_rate,
+        poll_interval=args.poll_interval, ws_batches=args.ws_batches, port=args.port,
+    ))
+    print(json.dumps(results, indent=2))
+    if args.json:
+        write_results(args.json, {"load": results})
+
+if __name__ == "__main__":
+    main_cli()
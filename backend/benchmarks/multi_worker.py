@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+"""
+Multi-worker coordination harness
+Starts a fake NewsAPI and N uvicorn workers sharing one article store, then
+checks that only the elected leader polls upstream, that articles it fetches
+reach WebSocket clients on every worker, and that a follower takes over
+polling when the leader is killed.
+
+Usage: python backend/benchmarks/multi_worker.py --workers 3
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+
+import httpx
+import websockets
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from benchmarks.fake_newsapi import FakeNewsAPI  # noqa: E402
+
+WORDS = ["senate", "ballot", "coalition", "tariff", "treaty", "minister", "budget", "reform",
+         "border", "veto", "referendum", "cabinet", "embassy", "census", "subsidy", "mandate"]
+
+def breaking_article(rng_seed: str) -> dict:
+    """A NewsAPI-shaped article unlike the others, so clustering keeps it"""
+    words = [WORDS[int(c, 16)] for c in rng_seed[:8]]
+    return {
+        "source": {"id": None, "name": "Reuters"},
+        "author": "Harness",
+        "title": f"{' '.join(words).capitalize()} politics update {rng_seed[:6]}",
+        "description": f"Government statement on {' and '.join(words[:3])}.",
+        "url": f"https://news.example.com/harness/{rng_seed}",
+        "urlToImage": None,
+        "publishedAt": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "content": f"{' '.join(words)}. [+{len(rng_seed)} chars]",
+    }
+
+class Worker:
+    def __init__(self, port: int, env: dict):
+        self.port = port
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+            cwd=BACKEND_DIR, env=env,
+        )
+        self.received = set()
+        self._listener = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    async def wait_ready(self, client: httpx.AsyncClient, timeout: float = 30):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(f"{self.url}/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+        raise RuntimeError(f"worker on port {self.port} did not start")
+
+    async def role(self, client: httpx.AsyncClient) -> str:
+        stats = (await client.get(f"{self.url}/api/v1/stats/cache")).json()
+        return stats["worker"]["role"]
+
+    async def listen(self):
+        async def run():
+            async with websockets.connect(f"ws://127.0.0.1:{self.port}/ws") as ws:
+                async for raw in ws:
+                    message = json.loads(raw)
+                    if message.get("type") == "new_article":
+                        self.received.add(message["article"]["url"])
+        self._listener = asyncio.create_task(run())
+
+    def stop(self, sig=signal.SIGTERM):
+        if self._listener:
+            self._listener.cancel()
+        if self.process.poll() is None:
+            self.process.send_signal(sig)
+            self.process.wait(timeout=10)
+
+async def wait_for(workers, urls, timeout: float) -> float:
+    start = time.monotonic()
+    while time.monotonic() - start < timeout:
+        if all(urls <= w.received for w in workers):
+            return time.monotonic() - start
+        await asyncio.sleep(0.1)
+    return -1
+
+async def main(args):
+    fake = await FakeNewsAPI(corpus_size=args.corpus_size).start()
+    tmp = tempfile.mkdtemp(prefix="news-intel-harness-")
+    env = dict(
+        os.environ,
+        NEWS_API_URL=fake.base_url,
+        ARTICLE_STORE_PATH=os.path.join(tmp, "articles.db"),
+        WORKER_LOCK_PATH=os.path.join(tmp, "leader.lock"),
+        WORKER_SOCKET_PATH=os.path.join(tmp, "leader.sock"),
+        NEWSAPI_DAILY_QUOTA="1000000",
+        POLL_MIN_INTERVAL=str(args.poll_interval),
+        POLL_MAX_INTERVAL=str(args.poll_interval),
+    )
+    workers = [Worker(args.port + i, env) for i in range(args.workers)]
+    results = {"workers": args.workers}
+    try:
+        async with httpx.AsyncClient() as client:
+            for worker in workers:
+                await worker.wait_ready(client)
+            for worker in workers:
+                await worker.listen()
+            await asyncio.sleep(1)
+
+            roles = [await w.role(client) for w in workers]
+            results["leaders"] = roles.count("leader")
+            leader = workers[roles.index("leader")]
+
+            # Only the leader should poll: count upstream calls over a few intervals
+            before = fake.requests
+            await asyncio.sleep(args.poll_interval * 3)
+            results["upstream_requests_per_interval"] = round((fake.requests - before) / 3, 2)
+
+            batch = [breaking_article(uuid.uuid4().hex) for _ in range(args.batch)]
+            fake.corpus[:0] = batch
+            urls = {a["url"] for a in batch}
+            results["delivery_seconds"] = round(await wait_for(workers, urls, args.poll_interval * 5), 2)
+            results["delivered_to_all_workers"] = results["delivery_seconds"] >= 0
+
+            if args.failover:
+                leader.stop(signal.SIGKILL)
+                survivors = [w for w in workers if w is not leader]
+                batch = [breaking_article(uuid.uuid4().hex) for _ in range(args.batch)]
+                fake.corpus[:0] = batch
+                urls = {a["url"] for a in batch}
+                results["failover_delivery_seconds"] = round(
+                    await wait_for(survivors, urls, args.poll_interval * 5 + 10), 2
+                )
+                roles = [await w.role(client) for w in survivors]
+                results["leaders_after_failover"] = roles.count("leader")
+    finally:
+        for worker in workers:
+            worker.stop()
+        await fake.stop()
+
+    print(json.dumps(results, indent=2))
+    ok = results.get("leaders") == 1 and results.get("delivered_to_all_workers")
+    if args.failover:
+        ok = ok and results.get("leaders_after_failover") == 1 and results.get("failover_delivery_seconds", -1) >= 0
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=3)
+    parser.add_argument("--port", type=int, default=8100, help="First worker port")
+    parser.add_argument("--poll-interval", type=float, default=2.0)
+    parser.add_argument("--batch", type=int, default=5, help="Articles injected per round")
+    parser.add_argument("--corpus-size", type=int, default=50)
+    parser.add_argument("--no-failover", dest="failover", action="store_false")
+    sys.exit(asyncio.run(main(parser.parse_args())))
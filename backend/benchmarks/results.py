@@ -0,0 +1,98 @@
+"""
+Benchmark result helpers
+Latency summaries (req/s and p50/p95/p99) and the JSON result files the
+perf suite writes, including a comparison against a saved baseline.
+"""
+
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    rank = min(len(ordered), max(1, math.ceil(fraction * len(ordered))))
+    return ordered[rank - 1]
+
+def latency_summary(samples: List[float], elapsed: Optional[float] = None, errors: int = 0) -> Dict[str, Any]:
+    """Request count, throughput and latency percentiles (ms) for per-request durations in seconds"""
+    ordered = sorted(samples)
+    summary = {
+        "requests": len(ordered),
+        "errors": errors,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3) if ordered else 0.0,
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+    }
+    if elapsed:
+        summary["req_per_s"] = round(len(ordered) / elapsed, 1)
+    return summary
+
+def environment() -> Dict[str, Any]:
+    """Where the numbers came from: interpreter, machine and git revision"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "commit": commit,
+    }
+
+def write_results(path: str, results: Dict[str, Any]) -> Dict[str, Any]:
+    document = {"environment": environment(), "results": results}
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+    return document
+
+# Metrics where a larger value is better; every other *_ms / *_us metric is a latency
+HIGHER_IS_BETTER = ("req_per_s", "per_s", "speedup")
+
+def _flatten(prefix: str, value: Any, out: Dict[str, float]):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _flatten(f"{prefix}.{key}" if prefix else key, item, out)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        out[prefix] = float(value)
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            tolerance: float = 0.2) -> List[Tuple[str, float, float, float]]:
+    """Regressions beyond `tolerance` between two result documents
+
+    Only throughput (req/s) and latency (ms/us) metrics are compared.
+    Returns (metric, baseline, current, relative change) tuples.
+    """
+    before: Dict[str, float] = {}
+    after: Dict[str, float] = {}
+    _flatten("", baseline.get("results", baseline), before)
+    _flatten("", current.get("results", current), after)
+    regressions = []
+    for name, old in before.items():
+        new = after.get(name)
+        if new is None or old <= 0:
+            continue
+        leaf = name.rsplit(".", 1)[-1]
+        if leaf.endswith(HIGHER_IS_BETTER):
+            change = (old - new) / old
+        elif leaf.endswith(("_ms", "_us")):
+            change = (new - old) / old
+        else:
+            continue
+        if change > tolerance:
+            regressions.append((name, old, new, change))
+    return regressions
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""
+Performance suite
+Runs the article processing micro-benchmark and the HTTP/WebSocket load
+test against the fake NewsAPI, writes one JSON result file and, given a
+baseline file, fails on any throughput or latency regression beyond the
+tolerance.
+
+Usage: python backend/benchmarks/run_suite.py --output perf.json --baseline perf-baseline.json --tolerance 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import bench_process_article, load_test  # noqa: E402
+from benchmarks.results import compare, write_results  # noqa: E402
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", help="Result file (default: perf-<timestamp>.json)")
+    parser.add_argument("--baseline", help="Earlier result file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression")
+    parser.add_argument("--articles", type=int, default=2000)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per HTTP scenario")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--ws-clients", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake upstream latency (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fake upstream failure fraction")
+    parser.add_argument("--skip-load", action="store_true", help="Only run the micro-benchmarks")
+    args = parser.parse_args()
+
+    results = {"process_article": bench_process_article.run(args.articles)}
+    if not args.skip_load:
+        results["load"] = asyncio.run(load_test.run(
+            duration=args.duration, concurrency=args.concurrency, ws_clients=args.ws_clients,
+            latency=args.latency, error_rate=args.error_rate,
+        ))
+
+    output = args.output or f"perf-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    document = write_results(output, results)
+    print(json.dumps(document, indent=2))
+    print(f"\nResults written to {output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, document, args.tolerance)
+        for name, old, new, change in regressions:
+            print(f"REGRESSION {name}: {old:g} -> {new:g} ({change:+.0%})")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+
+if __name__ == "__main__":
+    main_cli()
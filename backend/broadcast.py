@@ -0,0 +1,293 @@
+"""
+WebSocket broadcast engine
+Every connection owns a bounded send queue drained by its own writer task,
+so one slow client can never stall delivery to the others. Clients subscribe
+to channels and published messages only reach matching subscribers.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from enum import Enum
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi import WebSocket
+
+from metrics import STAGE_SECONDS
+from serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+_BROADCAST_SECONDS = STAGE_SECONDS.labels("broadcast")
+
+# Clients on the firehose receive every published message. Unsubscribed
+# clients start there, as do subscribers of these legacy channel names.
+FIREHOSE = "*"
+FIREHOSE_ALIASES = {"*", "all", "politics"}
+CHANNEL_KINDS = {"topic", "region", "bias", "source"}
+
+def normalize_channel(channel: Any) -> Optional[str]:
+    """Canonical "kind:value" channel name, FIREHOSE, or None if invalid"""
+    if not isinstance(channel, str):
+        return None
+    channel = " ".join(channel.split()).lower()
+    if channel in FIREHOSE_ALIASES:
+        return FIREHOSE
+    kind, sep, value = channel.partition(":")
+    if not sep or kind not in CHANNEL_KINDS or not value.strip():
+        return None
+    return f"{kind}:{value.strip()}"
+
+class OverflowPolicy(str, Enum):
+    """What to do when a client's send queue is full"""
+    DROP_OLDEST = "drop_oldest"  # discard the oldest queued message
+    COALESCE = "coalesce"        # replace a queued message with the same key, else drop oldest
+    DISCONNECT = "disconnect"    # evict the client; it can reconnect and resync
+
+class SeenSet:
+    """Bounded LRU of article ID -> content fingerprint already pushed
+
+    Lets the publisher skip articles clients have already received, while
+    still pushing an article again when its content fingerprint changes.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._seen: "OrderedDict[str, str]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def mark(self, article_id: str, fingerprint: str) -> Optional[str]:
+        """Record an article; returns "new", "updated", or None if already seen"""
+        previous = self._seen.get(article_id)
+        if previous is not None:
+            self._seen.move_to_end(article_id)
+            if previous == fingerprint:
+                return None
+        self._seen[article_id] = fingerprint
+        while len(self._seen) > self.max_size:
+            self._seen.popitem(last=False)
+        return "new" if previous is None else "updated"
+
+class ClientConnection:
+    """A connected socket plus its bounded outbound queue and writer task"""
+
+    def __init__(self, websocket: WebSocket, manager: "ConnectionManager"):
+        self.websocket = websocket
+        self.manager = manager
+        self.queue: Deque[Tuple[Optional[str], str]] = deque()
+        self.channels: Set[str] = set()
+        self.dropped = 0
+        self.sent = 0
+        self._wakeup = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+        self.closed = False
+
+    def start(self):
+        self._writer = asyncio.create_task(self._write_loop())
+
+    def enqueue(self, text: str, key: Optional[str] = None) -> bool:
+        """Queue a pre-serialized message; False if the client was evicted"""
+        if self.closed:
+            return False
+        if len(self.queue) >= self.manager.queue_size:
+            policy = self.manager.overflow_policy
+            if policy == OverflowPolicy.DISCONNECT:
+                self.manager.evict(self, reason="send queue overflow")
+                return False
+            self.dropped += 1
+            if policy == OverflowPolicy.COALESCE and key is not None:
+                for i, (queued_key, _) in enumerate(self.queue):
+                    if queued_key == key:
+                        self.queue[i] = (key, text)
+                        return True
+            self.queue.popleft()
+        self.queue.append((key, text))
+        self._wakeup.set()
+        return True
+
+    async def _write_loop(self):
+        timeout = self.manager.send_timeout
+        try:
+            while True:
+                if not self.queue:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                _, text = self.queue.popleft()
+                await asyncio.wait_for(self.websocket.send_text(text), timeout)
+                self.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.manager.evict(self, reason=f"send failed: {e!r}")
+
+    def stop(self):
+        self.closed = True
+        self.queue.clear()
+        if self._writer is not None and self._writer is not asyncio.current_task():
+            self._writer.cancel()
+
+class ConnectionManager:
+    """Tracks WebSocket clients and fans messages out to their queues
+
+    Broadcast serializes a message once and only appends the resulting text
+    to each client's queue, so its cost is O(clients) with no awaits. Clients
+    whose writer fails or times out are evicted automatically.
+    """
+
+    def __init__(self, queue_size: int = 100, overflow_policy: str = OverflowPolicy.DROP_OLDEST,
+                 send_timeout: float = 10.0):
+        self.queue_size = queue_size
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.send_timeout = send_timeout
+        self.active_connections: Dict[WebSocket, ClientConnection] = {}
+        self.subscribers: Dict[str, Set[ClientConnection]] = {FIREHOSE: set()}
+        # The loop only holds weak references to tasks; keep closes alive
+        self._closing: Set[asyncio.Task] = set()
+        self.evicted = 0
+        self.broadcasts = 0
+
+    async def connect(self, websocket: WebSocket) -> ClientConnection:
+        await websocket.accept()
+        client = ClientConnection(websocket, self)
+        self.active_connections[websocket] = client
+        self.subscribers[FIREHOSE].add(client)
+        client.start()
+        return client
+
+    def disconnect(self, websocket: WebSocket):
+        client = self.active_connections.pop(websocket, None)
+        if client is not None:
+            self._unindex(client)
+            client.stop()
+
+    def evict(self, client: ClientConnection, reason: str = ""):
+        if self.active_connections.pop(client.websocket, None) is None:
+            return
+        self._unindex(client)
+        self.evicted += 1
+        logger.info(f"Evicting WebSocket client: {reason}")
+        client.stop()
+        task = asyncio.create_task(self._close(client.websocket))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close(websocket: WebSocket):
+        try:
+            await websocket.close(code=1011)
+        except Exception:
+            pass
+
+    def _unindex(self, client: ClientConnection):
+        self.subscribers[FIREHOSE].discard(client)
+        for channel in client.channels:
+            subscribers = self.subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.discard(client)
+                if not subscribers:
+                    del self.subscribers[channel]
+        client.channels.clear()
+
+    def subscribe(self, websocket: WebSocket, channel: Any) -> Optional[str]:
+        """Add a channel subscription; returns the normalized channel or None"""
+        client = self.active_connections.get(websocket)
+        channel = normalize_channel(channel)
+        if client is None or channel is None:
+            return None
+        if channel == FIREHOSE:
+            self.subscribers[FIREHOSE].add(client)
+            return channel
+        if not client.channels:
+            # First specific subscription takes the client off the firehose
+            self.subscribers[FIREHOSE].discard(client)
+        client.channels.add(channel)
+        self.subscribers.setdefault(channel, set()).add(client)
+        return channel
+
+    def unsubscribe(self, websocket: WebSocket, channel: Any) -> Optional[str]:
+        client = self.active_connections.get(websocket)
+        channel = normalize_channel(channel)
+        if client is None or channel is None:
+            return None
+        if channel == FIREHOSE:
+            if client.channels:
+                self.subscribers[FIREHOSE].discard(client)
+            return channel
+        client.channels.discard(channel)
+        subscribers = self.subscribers.get(channel)
+        if subscribers is not None:
+            subscribers.discard(client)
+            if not subscribers:
+                del self.subscribers[channel]
+        if not client.channels:
+            self.subscribers[FIREHOSE].add(client)
+        return channel
+
+    @staticmethod
+    def serialize(message: Any) -> str:
+        return dumps(message).decode()
+
+    def send(self, websocket: WebSocket, message: Any) -> bool:
+        """Queue a message (dict, or raw text) for a single client"""
+        client = self.active_connections.get(websocket)
+        text = message if isinstance(message, str) else self.serialize(message)
+        return client is not None and client.enqueue(text)
+
+    def broadcast_text(self, text: str, clients: Optional[List[ClientConnection]] = None,
+                       key: Optional[str] = None) -> int:
+        """Queue already-serialized text for many clients; returns how many accepted it"""
+        start = time.perf_counter()
+        self.broadcasts += 1
+        targets = list(self.active_connections.values()) if clients is None else clients
+        accepted = sum(1 for client in targets if client.enqueue(text, key))
+        _BROADCAST_SECONDS.observe(time.perf_counter() - start)
+        return accepted
+
+    async def broadcast(self, message: dict, key: Optional[str] = None) -> int:
+        """Serialize once and queue for every connected client"""
+        return self.broadcast_text(self.serialize(message), key=key)
+
+    def wants(self, websocket: WebSocket, channels: Iterable[str]) -> bool:
+        """Whether a single client would receive a message on `channels`"""
+        client = self.active_connections.get(websocket)
+        if client is None:
+            return False
+        return client in self.subscribers[FIREHOSE] or not client.channels.isdisjoint(channels)
+
+    def matching_clients(self, channels: Iterable[str]) -> Set[ClientConnection]:
+        """Firehose clients plus subscribers of any of `channels`"""
+        targets = set(self.subscribers[FIREHOSE])
+        for channel in channels:
+            subscribers = self.subscribers.get(channel)
+            if subscribers:
+                targets.update(subscribers)
+        return targets
+
+    async def publish(self, message: dict, channels: Iterable[str], key: Optional[str] = None) -> int:
+        """Serialize once and queue only for clients subscribed to a matching channel"""
+        targets = self.matching_clients(channels)
+        if not targets:
+            return 0
+        return self.broadcast_text(self.serialize(message), clients=list(targets), key=key)
+
+    async def close_all(self):
+        for websocket in list(self.active_connections):
+            self.disconnect(websocket)
+
+    def stats(self) -> Dict[str, Any]:
+        clients = list(self.active_connections.values())
+        return {
+            "connections": len(clients),
+            "queuedMessages": sum(len(c.queue) for c in clients),
+            "maxQueueDepth": max((len(c.queue) for c in clients), default=0),
+            "droppedMessages": sum(c.dropped for c in clients),
+            "evicted": self.evicted,
+            "broadcasts": self.broadcasts,
+            "firehoseClients": len(self.subscribers[FIREHOSE]),
+            "channels": len(self.subscribers) - 1,
+            "overflowPolicy": self.overflow_policy.value,
+        }
@@ -0,0 +1,94 @@
+"""
+Upstream circuit breaker
+After `failure_threshold` consecutive upstream failures the circuit opens
+and calls fail immediately instead of waiting on a dead upstream. Once
+`reset_timeout` has passed a single probe is let through (half-open): its
+success closes the circuit, its failure opens it again.
+"""
+
+import time
+from typing import Any, Dict, Optional, Tuple, Type
+
+from scheduler import UpstreamError
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+class CircuitOpen(UpstreamError):
+    """Call refused without contacting the upstream because the circuit is open"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(503, retry_after=retry_after, message="upstream circuit open")
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker used as `async with breaker: <upstream call>`
+
+    Exceptions listed in `ignore` (for example local rate-limit refusals)
+    pass through without counting as upstream failures.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 ignore: Tuple[Type[BaseException], ...] = ()):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.ignore = ignore
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.opens = 0
+        self.rejected = 0
+        self._probing = False
+
+    def _retry_after(self, now: float) -> float:
+        return max(0.0, self.opened_at + self.reset_timeout - now)
+
+    def before(self, now: Optional[float] = None):
+        """Admit a call or raise CircuitOpen"""
+        now = now or time.monotonic()
+        if self.state == OPEN and self._retry_after(now) <= 0:
+            self.state = HALF_OPEN
+        if self.state == OPEN or (self.state == HALF_OPEN and self._probing):
+            self.rejected += 1
+            raise CircuitOpen(self._retry_after(now) if self.state == OPEN else self.reset_timeout)
+        if self.state == HALF_OPEN:
+            self._probing = True
+
+    def success(self):
+        self.state = CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def failure(self, now: Optional[float] = None):
+        self.failures += 1
+        self._probing = False
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.opens += 1
+            self.state = OPEN
+            self.opened_at = now or time.monotonic()
+
+    async def __aenter__(self):
+        self.before()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.success()
+        elif issubclass(exc_type, self.ignore) or not issubclass(exc_type, Exception):
+            # Refused locally or cancelled: says nothing about the upstream
+            self._probing = False
+        else:
+            self.failure()
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        state = self.state
+        if state == OPEN and self._retry_after(now) <= 0:
+            state = HALF_OPEN
+        return {
+            "state": state,
+            "consecutiveFailures": self.failures,
+            "opens": self.opens,
+            "rejected": self.rejected,
+            "retryInSeconds": round(self._retry_after(now), 1) if state == OPEN else None,
+        }
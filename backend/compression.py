@@ -0,0 +1,179 @@
+"""
+HTTP response compression and conditional GET helpers
+Compresses responses with Brotli (when installed) or gzip according to the
+client's Accept-Encoding, skipping bodies under a size threshold. Each
+encoded variant gets its own strong ETag ("<tag>-br", "<tag>-gzip"), and
+`etag_matches` accepts any variant of a tag in If-None-Match.
+"""
+
+import zlib
+from typing import Iterable, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional, gzip is used instead
+    brotli = None
+
+ENCODING_SUFFIXES = ("-br", "-gzip")
+
+def accepted_encoding(header: str) -> Optional[str]:
+    """Preferred supported encoding in an Accept-Encoding header, if any"""
+    offered = {}
+    for part in header.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        offered[name.strip()] = quality
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if offered.get(encoding, offered.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header names `etag` (weak comparison, any encoded variant)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        for suffix in ENCODING_SUFFIXES:
+            if candidate.endswith(f'{suffix}"'):
+                candidate = candidate[:-len(suffix) - 1] + '"'
+                break
+        if candidate == etag:
+            return True
+    return False
+
+def _variant_etag(etag: str, encoding: str) -> str:
+    weak = etag.startswith("W/")
+    tag = etag[2:] if weak else etag
+    return f'{"W/" if weak else ""}{tag[:-1]}-{encoding}"'
+
+class _Encoder:
+    """Incremental gzip or Brotli compressor"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        if encoding == "br":
+            compressor = brotli.Compressor(quality=brotli_quality)
+            self.compress, self.finish = compressor.process, compressor.finish
+        else:
+            compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self.compress, self.finish = compressor.compress, compressor.flush
+
+def _set_header(headers: List[Tuple[bytes, bytes]], name: bytes, value: bytes):
+    headers[:] = [(k, v) for k, v in headers if k.lower() != name]
+    headers.append((name, value))
+
+def _get_header(headers: Iterable[Tuple[bytes, bytes]], name: bytes) -> Optional[bytes]:
+    for k, v in headers:
+        if k.lower() == name:
+            return v
+    return None
+
+def _add_vary(headers: List[Tuple[bytes, bytes]], field: bytes):
+    """Append `field` to Vary, keeping fields set by earlier middleware (e.g. CORS's Origin)"""
+    fields = [
+        f.strip() for k, v in headers if k.lower() == b"vary" for f in v.split(b",") if f.strip()
+    ]
+    if b"*" in fields or field.lower() in (f.lower() for f in fields):
+        return
+    _set_header(headers, b"vary", b", ".join(fields + [field]))
+
+class CompressionMiddleware:
+    """ASGI middleware compressing HTTP responses of at least `minimum_size` bytes
+
+    Single-message bodies are compressed in one go with a Content-Length;
+    streamed bodies are compressed incrementally. Responses that already
+    carry a Content-Encoding, and 304s, are passed through (a 304 echoes the
+    encoded ETag variant the client asked about).
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 5):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_headers = dict(scope["headers"])
+        encoding = accepted_encoding(request_headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        if_none_match = request_headers.get(b"if-none-match", b"").decode("latin-1")
+
+        start_message = None
+        encoder: Optional[_Encoder] = None
+
+        async def send_compressed(message):
+            nonlocal start_message, encoder
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if start_message is None:
+                # Headers already sent; compress the rest of the stream if we started to
+                if encoder is not None:
+                    more_body = message.get("more_body", False)
+                    data = encoder.compress(message.get("body", b""))
+                    if not more_body:
+                        data += encoder.finish()
+                    message = {"type": "http.response.body", "body": data, "more_body": more_body}
+                await send(message)
+                return
+
+            start, start_message = start_message, None
+            headers = list(start.get("headers", []))
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            _add_vary(headers, b"Accept-Encoding")
+            if (
+                start["status"] == 304
+                or _get_header(headers, b"content-encoding") is not None
+                or (not more_body and len(body) < self.minimum_size)
+            ):
+                if start["status"] == 304:
+                    self._echo_variant(headers, if_none_match)
+                await send({**start, "headers": headers})
+                await send(message)
+                return
+
+            encoder = _Encoder(encoding, self.gzip_level, self.brotli_quality)
+            _set_header(headers, b"content-encoding", encoding.encode())
+            etag = _get_header(headers, b"etag")
+            if etag is not None:
+                _set_header(headers, b"etag", _variant_etag(etag.decode("latin-1"), encoding).encode("latin-1"))
+            data = encoder.compress(body)
+            if more_body:
+                headers = [(k, v) for k, v in headers if k.lower() != b"content-length"]
+            else:
+                data += encoder.finish()
+                _set_header(headers, b"content-length", str(len(data)).encode())
+            await send({**start, "headers": headers})
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+    @staticmethod
+    def _echo_variant(headers: List[Tuple[bytes, bytes]], if_none_match: str):
+        etag = _get_header(headers, b"etag")
+        if etag is None:
+            return
+        etag = etag.decode("latin-1")
+        for suffix in ENCODING_SUFFIXES:
+            variant = _variant_etag(etag, suffix[1:])
+            if variant in if_none_match:
+                _set_header(headers, b"etag", variant.encode("latin-1"))
+                return
@@ -0,0 +1,171 @@
+"""
+Multi-worker coordination
+Workers that share an article store elect a single leader through an
+exclusive file lock. Only the leader polls upstream; it relays every batch
+of stored changes to the other workers over a Unix domain socket so each
+one can push them to its own WebSocket clients.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+from serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+# Relayed batches can hold many full article payloads on one line
+MAX_MESSAGE_BYTES = 32 * 1024 * 1024
+
+class WorkerCoordinator:
+    """Leader election over `lock_path` plus a leader -> followers relay on `socket_path`
+
+    `on_elected()` runs once when this worker becomes leader (for example to
+    start polling). Followers receive every relayed message through
+    `on_message(message)`. A follower that loses its leader retries the lock,
+    so another worker takes over when the leader exits. Without fcntl every
+    worker runs as its own leader.
+    """
+
+    def __init__(
+        self,
+        lock_path: str,
+        socket_path: str,
+        on_elected: Callable[[], Awaitable[None]],
+        on_message: Callable[[Dict[str, Any]], Awaitable[None]],
+        retry_interval: float = 1.0,
+        max_buffer: int = 8 * 1024 * 1024,
+    ):
+        self.lock_path = lock_path
+        self.socket_path = socket_path
+        self.on_elected = on_elected
+        self.on_message = on_message
+        self.retry_interval = retry_interval
+        self.max_buffer = max_buffer
+        self.is_leader = False
+        self.relayed = 0
+        self.received = 0
+        self.dropped_followers = 0
+        self._lock_fd: Optional[int] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._followers: Set[asyncio.StreamWriter] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def _try_lock(self) -> bool:
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._lock_fd = fd
+        return True
+
+    async def start(self):
+        if fcntl is None:
+            logger.info("fcntl unavailable; worker coordination disabled")
+            await self._become_leader(serve=False)
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            if self._try_lock():
+                await self._become_leader()
+                return
+            try:
+                await self._follow()
+            except (ConnectionError, FileNotFoundError, asyncio.IncompleteReadError):
+                pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Leader relay failed: {e!r}")
+            await asyncio.sleep(self.retry_interval)
+
+    async def _become_leader(self, serve: bool = True):
+        self.is_leader = True
+        if serve:
+            # A stale socket left by a crashed leader would make bind fail
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            self._server = await asyncio.start_unix_server(self._serve_follower, path=self.socket_path)
+        logger.info(f"Worker {os.getpid()} elected leader")
+        await self.on_elected()
+
+    async def _serve_follower(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._followers.add(writer)
+        try:
+            # Followers never send; EOF means they went away
+            await reader.read()
+        except ConnectionError:
+            pass
+        finally:
+            self._followers.discard(writer)
+            writer.close()
+
+    async def _follow(self):
+        reader, writer = await asyncio.open_unix_connection(self.socket_path, limit=MAX_MESSAGE_BYTES)
+        logger.info(f"Worker {os.getpid()} following leader at {self.socket_path}")
+        try:
+            # Catch up on anything relayed before we connected
+            await self.on_message({"type": "resync"})
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                self.received += 1
+                await self.on_message(loads(line))
+        finally:
+            writer.close()
+
+    def relay(self, message: Dict[str, Any]):
+        """Send a message to every follower (no-op unless leader)"""
+        if not self._followers:
+            return
+        data = dumps(message) + b"\n"
+        for writer in list(self._followers):
+            if writer.transport.get_write_buffer_size() > self.max_buffer:
+                # Too far behind; it resyncs from the store when it reconnects
+                self._followers.discard(writer)
+                self.dropped_followers += 1
+                writer.close()
+                continue
+            writer.write(data)
+        self.relayed += 1
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._followers):
+                writer.close()
+            self._followers.clear()
+            self._server = None
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+        self.is_leader = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "role": "leader" if self.is_leader else "follower",
+            "followers": len(self._followers),
+            "relayedBatches": self.relayed,
+            "receivedBatches": self.received,
+            "droppedFollowers": self.dropped_followers,
+        }
@@ -0,0 +1,106 @@
+"""
+Streaming article statistics
+Sliding-window counters kept in fixed-size ring buffers, so recording an
+article and reading the dashboard totals cost the same no matter how many
+articles have been ingested.
+"""
+
+import heapq
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+class SlidingWindowCounter:
+    """Keyed counts over the last `window` seconds, split into `buckets` ring slots
+
+    Each slot holds the counts of one `window / buckets` span. Running totals
+    are adjusted as events arrive and as slots expire, so reads never scan
+    the ring.
+    """
+
+    def __init__(self, window: float, buckets: int = 60):
+        self.window = window
+        self.span = window / buckets
+        self._ring: List[Counter] = [Counter() for _ in range(buckets)]
+        self._head: Optional[int] = None  # absolute index of the newest slot
+        self.totals: Counter = Counter()
+
+    def _advance(self, now: float):
+        index = int(now // self.span)
+        if self._head is None:
+            self._head = index
+            return
+        if index - self._head >= len(self._ring):
+            for slot in self._ring:
+                slot.clear()
+            self.totals.clear()
+            self._head = index
+            return
+        while self._head < index:
+            self._head += 1
+            expired = self._ring[self._head % len(self._ring)]
+            if expired:
+                self.totals.subtract(expired)
+                for key in list(expired):
+                    if self.totals[key] <= 0:
+                        del self.totals[key]
+                expired.clear()
+
+    def add(self, key: str, count: int = 1, at: Optional[float] = None, now: Optional[float] = None):
+        """Count `key` at time `at` (default now); events outside the window are ignored"""
+        now = now or time.time()
+        self._advance(now)
+        index = int(min(at or now, now) // self.span)
+        if self._head - index >= len(self._ring):
+            return
+        self._ring[index % len(self._ring)][key] += count
+        self.totals[key] += count
+
+    def get(self, key: str, now: Optional[float] = None) -> int:
+        self._advance(now or time.time())
+        return self.totals.get(key, 0)
+
+    def __len__(self) -> int:
+        return len(self.totals)
+
+    def top(self, limit: int, now: Optional[float] = None) -> List[Any]:
+        self._advance(now or time.time())
+        return heapq.nlargest(limit, self.totals.items(), key=lambda item: item[1])
+
+class ArticleStats:
+    """Per-window article totals, bias buckets, verified counts and source activity
+
+    Articles are counted at their publication time, so counters can be
+    rebuilt from the article store after a restart.
+    """
+
+    WINDOWS = {"1h": 3600, "24h": 86400}
+
+    def __init__(self, buckets: int = 60):
+        self.counts = {name: SlidingWindowCounter(seconds, buckets) for name, seconds in self.WINDOWS.items()}
+        self.sources = {name: SlidingWindowCounter(seconds, buckets) for name, seconds in self.WINDOWS.items()}
+        self.recorded = 0
+
+    def record(self, published_ts: float, bias_level: Optional[str], verified: bool,
+               source: Optional[str], now: Optional[float] = None):
+        now = now or time.time()
+        self.recorded += 1
+        for name, counter in self.counts.items():
+            counter.add("articles", at=published_ts, now=now)
+            if bias_level:
+                counter.add(f"bias:{bias_level}", at=published_ts, now=now)
+            if verified:
+                counter.add("verified", at=published_ts, now=now)
+            self.sources[name].add(source or "Unknown", at=published_ts, now=now)
+
+    def window(self, name: str, top_sources: int = 5, now: Optional[float] = None) -> Dict[str, Any]:
+        now = now or time.time()
+        counts, sources = self.counts[name], self.sources[name]
+        busiest = sources.top(top_sources, now)
+        return {
+            "articles": counts.get("articles", now),
+            "verified": counts.get("verified", now),
+            "bias": {level: counts.get(f"bias:{level}", now) for level in ("low", "medium", "high")},
+            "sourcesActive": len(sources),
+            "topSources": [{"source": s, "articles": n} for s, n in busiest],
+        }
@@ -5,19 +5,46 @@ Backend API with NewsAPI Integration
 
 import os
 import asyncio
+import hashlib
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+import re
+import tempfile
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Any, Tuple
 from contextlib import asynccontextmanager
 
 import httpx
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Query
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 import random
 
+from article_ids import article_id_for
+from article_store import (
+    BREAKING_SECONDS, ArticleStore, decode_cursor, encode_cursor, payload_fingerprint, terms_pattern
+)
+from broadcast import ConnectionManager, SeenSet
+from circuit_breaker import CircuitBreaker
+from compression import CompressionMiddleware, etag_matches
+from coordination import WorkerCoordinator
+from live_stats import ArticleStats
+import metrics
+from metrics import REGISTRY, STAGE_SECONDS, timed
+from news_cache import ResponseCache, SingleFlight, make_query_key
+from rate_limit import QuotaExceeded, QuotaLedger, TokenBucket, UpstreamLimiter
+from scheduler import PollScheduler, PollStream, UpstreamError, parse_retry_after
+from search_index import SearchIndex, tokenize
+from serialization import FastJSONResponse, RawJSON, dumps, loads, raw_list
+from sharded_fetch import ShardedFetcher, build_shards, merge_newest_first
+from snapshot import ArticleSnapshot
+from story_clusters import StoryClusterer
+from text_analysis import KeywordMatcher
+from trending import TrendingTracker, extract_entities
+
 # Load environment variables
 load_dotenv()
 
@@ -32,10 +59,129 @@ logger = logging.getLogger(__name__)
 # Get your free key from https://newsapi.org/register
 # Using real NewsAPI key for live news data
 NEWS_API_KEY = "46b22d914f924ef086cf247254c0e5ab"  # Your NewsAPI key
-NEWS_API_URL = "https://newsapi.org/v2"
+NEWS_API_URL = os.getenv("NEWS_API_URL", "https://newsapi.org/v2")
 # Set to False to use real NewsAPI data, True for mock data
 USE_MOCK_DATA = False  # Using REAL news data from NewsAPI
 
+# Upstream HTTP client tuning - one pooled client is shared by every caller
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "10"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "15"))
+HTTP_WRITE_TIMEOUT = float(os.getenv("HTTP_WRITE_TIMEOUT", "5"))
+HTTP_POOL_TIMEOUT = float(os.getenv("HTTP_POOL_TIMEOUT", "5"))
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "true").lower() == "true"
+
+# Upstream response cache - fresh for CACHE_TTL_SECONDS, then served stale
+# for up to CACHE_STALE_SECONDS more while a background refresh runs
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "60"))
+CACHE_STALE_SECONDS = float(os.getenv("CACHE_STALE_SECONDS", "300"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "256"))
+
+# Persistent article store (SQLite) - REST reads go here first and only hit
+# NewsAPI when fewer than STORE_MIN_RESULTS local articles match
+ARTICLE_STORE_PATH = os.getenv(
+    "ARTICLE_STORE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "articles.db")
+)
+STORE_MIN_RESULTS = int(os.getenv("STORE_MIN_RESULTS", "10"))
+POLL_QUERY = "politics OR government OR election"
+
+# Adaptive polling: each stream's interval follows its article arrival rate
+# (aiming for POLL_TARGET_BATCH new articles per poll) within
+# [POLL_MIN_INTERVAL, POLL_MAX_INTERVAL], and is stretched further so polls
+# only use POLL_QUOTA_SHARE of the remaining NEWSAPI_DAILY_QUOTA.
+# POLL_REGIONS adds one stream per region ("all" or comma-separated keys).
+NEWSAPI_DAILY_QUOTA = int(os.getenv("NEWSAPI_DAILY_QUOTA", "100"))
+POLL_MIN_INTERVAL = float(os.getenv("POLL_MIN_INTERVAL", "60"))
+POLL_MAX_INTERVAL = float(os.getenv("POLL_MAX_INTERVAL", "1800"))
+POLL_TARGET_BATCH = int(os.getenv("POLL_TARGET_BATCH", "20"))
+POLL_QUOTA_SHARE = float(os.getenv("POLL_QUOTA_SHARE", "0.8"))
+POLL_BACKOFF_BASE = float(os.getenv("POLL_BACKOFF_BASE", "30"))
+POLL_BACKOFF_MAX = float(os.getenv("POLL_BACKOFF_MAX", "1800"))
+POLL_REGIONS = os.getenv("POLL_REGIONS", "")
+
+# Ingest mode: "streams" polls the query streams above one request at a
+# time; "sharded" polls a single stream that fans out concurrently over
+# TRUSTED_SOURCES in chunks of INGEST_SOURCES_PER_SHARD plus one query per
+# region, at most INGEST_CONCURRENCY requests in flight and up to
+# INGEST_MAX_PAGES pages per shard, merged into one newest-first batch.
+INGEST_MODE = os.getenv("INGEST_MODE", "streams")
+INGEST_CONCURRENCY = int(os.getenv("INGEST_CONCURRENCY", "4"))
+INGEST_SOURCES_PER_SHARD = int(os.getenv("INGEST_SOURCES_PER_SHARD", "4"))
+INGEST_MAX_PAGES = int(os.getenv("INGEST_MAX_PAGES", "2"))
+NEWSAPI_PAGE_SIZE = 100
+
+# Upstream rate limiting: a token bucket of UPSTREAM_BURST requests refilled
+# at UPSTREAM_REQUESTS_PER_MINUTE, in front of the daily quota ledger kept in
+# the article store. REST refills are refused once the remaining quota falls
+# to INGEST_QUOTA_RESERVE of NEWSAPI_DAILY_QUOTA; polls wait up to
+# UPSTREAM_MAX_WAIT seconds for a token.
+UPSTREAM_BURST = int(os.getenv("UPSTREAM_BURST", "20"))
+UPSTREAM_REQUESTS_PER_MINUTE = float(os.getenv("UPSTREAM_REQUESTS_PER_MINUTE", "10"))
+INGEST_QUOTA_RESERVE = float(os.getenv("INGEST_QUOTA_RESERVE", "0.5"))
+UPSTREAM_MAX_WAIT = float(os.getenv("UPSTREAM_MAX_WAIT", "60"))
+
+# Upstream circuit breaker: BREAKER_FAILURE_THRESHOLD consecutive failures
+# open it for BREAKER_RESET_TIMEOUT seconds, during which requests fail fast
+# to stored articles or the last-good snapshot at SNAPSHOT_PATH
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_TIMEOUT = float(os.getenv("BREAKER_RESET_TIMEOUT", "30"))
+SNAPSHOT_PATH = os.getenv("SNAPSHOT_PATH", os.path.splitext(ARTICLE_STORE_PATH)[0] + "-snapshot.json")
+SNAPSHOT_MAX_ARTICLES = int(os.getenv("SNAPSHOT_MAX_ARTICLES", "500"))
+
+# Multi-worker coordination: workers sharing ARTICLE_STORE_PATH elect one
+# leader through a file lock; only it polls, relaying stored changes to the
+# other workers over a Unix socket. Defaults are derived from the store path.
+_WORKER_PREFIX = os.path.join(
+    tempfile.gettempdir(),
+    "news-intel-" + hashlib.blake2b(os.path.abspath(ARTICLE_STORE_PATH).encode(), digest_size=4).hexdigest()
+)
+WORKER_LOCK_PATH = os.getenv("WORKER_LOCK_PATH", f"{_WORKER_PREFIX}.lock")
+WORKER_SOCKET_PATH = os.getenv("WORKER_SOCKET_PATH", f"{_WORKER_PREFIX}.sock")
+
+# Article processing runs off the event loop: "thread", "process" or "inline"
+PROCESS_EXECUTOR = os.getenv("PROCESS_EXECUTOR", "thread").lower()
+PROCESS_WORKERS = int(os.getenv("PROCESS_WORKERS", str(min(4, os.cpu_count() or 1))))
+PROCESS_CHUNK_SIZE = int(os.getenv("PROCESS_CHUNK_SIZE", "25"))
+
+# Near-duplicate clustering (MinHash/LSH over title + description)
+DEDUPE_THRESHOLD = float(os.getenv("DEDUPE_THRESHOLD", "0.5"))
+DEDUPE_MAX_ITEMS = int(os.getenv("DEDUPE_MAX_ITEMS", "5000"))
+
+# Local BM25 search; NewsAPI is only queried when fewer than
+# SEARCH_MIN_HITS local documents match
+SEARCH_INDEX_MAX_DOCS = int(os.getenv("SEARCH_INDEX_MAX_DOCS", "20000"))
+SEARCH_MIN_HITS = int(os.getenv("SEARCH_MIN_HITS", "5"))
+
+# Page size cap for the news endpoints; larger result sets are paged with
+# the opaque nextCursor returned by each response
+MAX_PAGE_LIMIT = int(os.getenv("MAX_PAGE_LIMIT", "100"))
+
+# Response compression: bodies smaller than COMPRESSION_MIN_SIZE bytes are
+# sent as-is; Brotli is preferred over gzip when the brotli package is installed
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "5"))
+
+# Trending topics: entity/topic mentions in a time-decayed Count-Min Sketch
+# (half-life in seconds), trend measured over consecutive windows
+TRENDING_HALF_LIFE = float(os.getenv("TRENDING_HALF_LIFE", "21600"))
+TRENDING_WINDOW = float(os.getenv("TRENDING_WINDOW", "3600"))
+TRENDING_CAPACITY = int(os.getenv("TRENDING_CAPACITY", "200"))
+
+# WebSocket fan-out: per-client bounded queues with an overflow policy of
+# "drop_oldest", "coalesce" or "disconnect"
+WS_QUEUE_SIZE = int(os.getenv("WS_QUEUE_SIZE", "100"))
+WS_OVERFLOW_POLICY = os.getenv("WS_OVERFLOW_POLICY", "drop_oldest")
+WS_SEND_TIMEOUT = float(os.getenv("WS_SEND_TIMEOUT", "10"))
+
+# Delta push: only articles not yet pushed (or whose content changed) go out.
+# Messages carry the store's change cursor; reconnecting clients send
+# {"type": "resume", "cursor": N} to replay up to WS_RESUME_MAX missed articles
+WS_SEEN_MAX = int(os.getenv("WS_SEEN_MAX", "10000"))
+WS_RESUME_MAX = int(os.getenv("WS_RESUME_MAX", "200"))
+
 # Global politics keywords and sources
 POLITICS_KEYWORDS = [
     "politics", "government", "election", "parliament", "congress",
@@ -44,32 +190,203 @@ POLITICS_KEYWORDS = [
     "trade agreement", "foreign policy", "international relations"
 ]
 
+# Analyzer vocabularies (simplified - would use ML models in production)
+EMOTIONAL_WORDS = ["shocking", "devastating", "incredible", "amazing", "terrible"]
+POSITIVE_WORDS = ["agreement", "success", "progress", "improvement", "cooperation"]
+NEGATIVE_WORDS = ["conflict", "crisis", "failure", "tension", "dispute"]
+TOPIC_KEYWORDS = POLITICS_KEYWORDS[:10]
+
 TRUSTED_SOURCES = [
     "bbc-news", "reuters", "associated-press", "the-washington-post",
     "the-guardian-uk", "cnn", "the-new-york-times", "al-jazeera-english",
     "politico", "the-economist", "financial-times", "bloomberg"
 ]
 
+TRUSTED_SOURCE_NAMES = {s.replace("-", " ").title() for s in TRUSTED_SOURCES}
+
+REGION_MAP = {
+    "north-america": "USA OR Canada OR Mexico",
+    "europe": "EU OR UK OR Germany OR France",
+    "asia": "China OR Japan OR India OR Korea",
+    "middle-east": "Middle East OR Saudi OR Iran OR Israel",
+    "africa": "Africa OR Nigeria OR Egypt OR South Africa",
+    "latin-america": "Brazil OR Argentina OR Mexico",
+    "oceania": "Australia OR New Zealand"
+}
+
 # Global WebSocket connections manager
-class ConnectionManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+manager = ConnectionManager(
+    queue_size=WS_QUEUE_SIZE,
+    overflow_policy=WS_OVERFLOW_POLICY,
+    send_timeout=WS_SEND_TIMEOUT,
+)
 
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
+# Articles already pushed to WebSocket clients, and the store cursor the
+# publisher has caught up to (set in lifespan)
+seen_articles = SeenSet(WS_SEEN_MAX)
+push_cursor = 0
+publish_lock = asyncio.Lock()
 
-    def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+# Processed articles outlive the request that fetched them
+article_store = ArticleStore(ARTICLE_STORE_PATH)
 
-    async def broadcast(self, message: dict):
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except:
-                pass
+# Upstream requests spent today (persisted in the store), shared by polling
+# and on-demand refills, behind a process-wide token bucket
+request_quota = QuotaLedger(NEWSAPI_DAILY_QUOTA, article_store)
+upstream_limiter = UpstreamLimiter(
+    TokenBucket(UPSTREAM_REQUESTS_PER_MINUTE / 60, UPSTREAM_BURST),
+    request_quota,
+    ingest_reserve=INGEST_QUOTA_RESERVE,
+    max_wait=UPSTREAM_MAX_WAIT,
+)
+
+# Sliding-window (1h/24h) counters behind /api/v1/stats/realtime, and the
+# trending-topic sketch behind /api/v1/trending/politics
+article_stats = ArticleStats()
+trending_tracker = TrendingTracker(
+    half_life=TRENDING_HALF_LIFE, window=TRENDING_WINDOW, capacity=TRENDING_CAPACITY
+)
+
+# Background poll streams (leader worker only) and the worker coordinator
+# (both created in lifespan)
+poll_scheduler: Optional[PollScheduler] = None
+coordinator: Optional[WorkerCoordinator] = None
+
+# Circuit breaker around NewsAPI calls (local quota refusals and 4xx
+# responses are not upstream outages) and the last-good article snapshot
+upstream_breaker = CircuitBreaker(
+    BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_TIMEOUT, ignore=(QuotaExceeded, httpx.HTTPStatusError)
+)
+article_snapshot = ArticleSnapshot(SNAPSHOT_PATH, SNAPSHOT_MAX_ARTICLES)
+
+# Prometheus metrics served at /metrics. Hot paths record directly; the
+# callback series read counters other components keep, at scrape time.
+UPSTREAM_REQUESTS = REGISTRY.counter(
+    "newsintel_upstream_requests_total", "NewsAPI requests by HTTP status or transport error", ["status"]
+)
+UPSTREAM_SECONDS = REGISTRY.histogram("newsintel_upstream_request_seconds", "NewsAPI request latency")
+LOOP_LAG = REGISTRY.gauge("newsintel_event_loop_lag_seconds", "Latest event loop wake-up delay")
+LOOP_LAG_SECONDS = REGISTRY.histogram(
+    "newsintel_event_loop_lag_observed_seconds", "Event loop wake-up delays",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+REGISTRY.counter(
+    "newsintel_upstream_refused_total", "Upstream requests refused locally by the rate limiter", ["priority"],
+    function=lambda: dict(upstream_limiter.refused)
+)
+REGISTRY.counter(
+    "newsintel_upstream_circuit_rejected_total", "Upstream requests failed fast by the open circuit",
+    function=lambda: upstream_breaker.rejected
+)
+REGISTRY.gauge(
+    "newsintel_upstream_circuit_state", "Upstream circuit state (0 closed, 1 half-open, 2 open)",
+    function=lambda: {"closed": 0, "half-open": 1, "open": 2}[upstream_breaker.stats()["state"]]
+)
+REGISTRY.gauge(
+    "newsintel_upstream_quota_remaining", "NewsAPI requests left in today's quota",
+    function=lambda: request_quota.remaining()
+)
+REGISTRY.counter(
+    "newsintel_cache_lookups_total", "Upstream response cache lookups by result", ["result"],
+    function=lambda: {"hit": news_cache.hits, "stale": news_cache.stale_hits, "miss": news_cache.misses}
+)
+REGISTRY.gauge(
+    "newsintel_websocket_connections", "Connected WebSocket clients",
+    function=lambda: len(manager.active_connections)
+)
+REGISTRY.gauge(
+    "newsintel_websocket_queued_messages", "Messages waiting in WebSocket send queues",
+    function=lambda: sum(len(c.queue) for c in manager.active_connections.values())
+)
+REGISTRY.gauge(
+    "newsintel_websocket_max_queue_depth", "Deepest WebSocket send queue",
+    function=lambda: max((len(c.queue) for c in manager.active_connections.values()), default=0)
+)
+REGISTRY.counter(
+    "newsintel_websocket_evictions_total", "WebSocket clients evicted for slow or failed sends",
+    function=lambda: manager.evicted
+)
+ANALYZE_SECONDS = STAGE_SECONDS.labels("analyze")
+loop_lag_task: Optional[asyncio.Task] = None
+
+# Shards and concurrent fetcher for INGEST_MODE=sharded
+ingest_shards = build_shards(POLL_QUERY, TRUSTED_SOURCES, INGEST_SOURCES_PER_SHARD, REGION_MAP)
+shard_fetcher = ShardedFetcher(
+    lambda shard, page: fetch_news_upstream(
+        query=shard.query, sources=shard.sources, page=page, priority="ingest"
+    ),
+    concurrency=INGEST_CONCURRENCY,
+    page_size=NEWSAPI_PAGE_SIZE,
+    max_pages=INGEST_MAX_PAGES,
+)
+
+# Shared upstream HTTP client (created in lifespan)
+http_client: Optional[httpx.AsyncClient] = None
+
+def create_http_client() -> httpx.AsyncClient:
+    """Build the pooled keep-alive client used for all NewsAPI calls"""
+    http2 = HTTP2_ENABLED
+    if http2:
+        try:
+            import h2  # noqa: F401  (httpx needs it for HTTP/2)
+        except ImportError:
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed, using HTTP/1.1")
+            http2 = False
+
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            connect=HTTP_CONNECT_TIMEOUT,
+            read=HTTP_READ_TIMEOUT,
+            write=HTTP_WRITE_TIMEOUT,
+            pool=HTTP_POOL_TIMEOUT,
+        ),
+    )
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it lazily outside of lifespan"""
+    global http_client
+    if http_client is None or http_client.is_closed:
+        http_client = create_http_client()
+    return http_client
+
+# Response cache shared by the REST endpoints and the periodic fetcher
+news_cache = ResponseCache(
+    ttl=CACHE_TTL_SECONDS,
+    stale_ttl=CACHE_STALE_SECONDS,
+    max_entries=CACHE_MAX_ENTRIES,
+)
+
+# Identical concurrent upstream queries share one in-flight request
+upstream_flight = SingleFlight()
+
+# Query key -> when the store was last refilled from it (politics or
+# search). The cached upstream batch is already stored for
+# CACHE_TTL_SECONDS afterwards, so a filter or query that stays sparse is
+# served locally instead of re-ingesting the same batch
+store_refills: Dict[Tuple[str, str, str], float] = {}
+
+# Syndicated copies of a story collapse into one canonical article
+story_clusterer = StoryClusterer(threshold=DEDUPE_THRESHOLD, max_items=DEDUPE_MAX_ITEMS)
 
-manager = ConnectionManager()
+# In-memory inverted index over stored articles for /api/v1/news/search
+search_index = SearchIndex(max_docs=SEARCH_INDEX_MAX_DOCS)
+
+# Worker pool for batch article processing (created in lifespan)
+processing_executor: Optional[Executor] = None
+
+def create_processing_executor() -> Optional[Executor]:
+    """Build the executor process_articles fans chunks out to"""
+    if PROCESS_EXECUTOR == "process":
+        return ProcessPoolExecutor(max_workers=PROCESS_WORKERS)
+    if PROCESS_EXECUTOR == "thread":
+        return ThreadPoolExecutor(max_workers=PROCESS_WORKERS, thread_name_prefix="process-article")
+    return None
 
 # Pydantic models
 class NewsArticle(BaseModel):
@@ -90,6 +407,8 @@ class NewsArticle(BaseModel):
     verified: bool = False
     breaking: bool = False
     factCheckStatus: Optional[str] = None
+    clusterId: Optional[str] = None
+    alternateSources: List[Dict[str, str]] = []
 
 class NewsFilters(BaseModel):
     region: str = "all"
@@ -102,15 +421,42 @@ class NewsFilters(BaseModel):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
+    global http_client, processing_executor, push_cursor, poll_scheduler, coordinator, loop_lag_task
     logger.info("Starting Global Politics Intelligence System...")
     
-    # Start background task for fetching news
-    task = asyncio.create_task(fetch_news_periodically())
+    # Open the shared upstream connection pool, the article store and the
+    # article processing pool
+    http_client = create_http_client()
+    processing_executor = create_processing_executor()
+    loop_lag_task = asyncio.create_task(metrics.monitor_loop_lag(LOOP_LAG, LOOP_LAG_SECONDS))
+    await asyncio.to_thread(article_store.open)
+    await asyncio.to_thread(article_snapshot.load)
+    await warm_indexes()
+    push_cursor = await asyncio.to_thread(article_store.latest_seq)
+    
+    # Only the elected leader worker polls upstream; the others follow it
+    coordinator = WorkerCoordinator(
+        WORKER_LOCK_PATH, WORKER_SOCKET_PATH, on_elected=start_polling, on_message=apply_relayed
+    )
+    await coordinator.start()
     
     yield
     
     # Cleanup
-    task.cancel()
+    if poll_scheduler is not None:
+        await poll_scheduler.stop()
+        poll_scheduler = None
+    await coordinator.stop()
+    coordinator = None
+    await manager.close_all()
+    await http_client.aclose()
+    http_client = None
+    loop_lag_task.cancel()
+    loop_lag_task = None
+    await asyncio.to_thread(article_store.close)
+    if processing_executor is not None:
+        processing_executor.shutdown(wait=False, cancel_futures=True)
+        processing_executor = None
     logger.info("System shutdown complete")
 
 # Create FastAPI app
@@ -118,6 +464,7 @@ app = FastAPI(
     title="Global Politics Intelligence API",
     version="2.0.0",
     description="Real-time global politics news analysis with AI-powered fact-checking and bias detection",
+    default_response_class=FastJSONResponse,
     lifespan=lifespan
 )
 
@@ -128,43 +475,93 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
+)
+
+# Compress responses (added last, so it wraps CORS and sees final headers)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=COMPRESSION_MIN_SIZE,
+    gzip_level=GZIP_LEVEL,
+    brotli_quality=BROTLI_QUALITY,
 )
 
 # News fetching and processing
-async def fetch_news_from_api(query: str = None, sources: str = None) -> List[Dict]:
-    """Fetch news from NewsAPI or return mock data"""
+async def fetch_news_from_api(query: str = None, sources: str = None,
+                              published_from: Optional[str] = None) -> List[Dict]:
+    """Fetch news from NewsAPI (through the response cache)
+
+    Upstream errors (including an open circuit) are raised, so callers that
+    persist results only store fresh upstream data and choose their own
+    fallback. `published_from` (see upstream_from) narrows query searches
+    by date.
+    """
     if USE_MOCK_DATA:
         logger.info("Using mock data for demonstration")
         return generate_mock_news()
     
-    async with httpx.AsyncClient() as client:
+    key = make_query_key(query, sources, published_from)
+    return await news_cache.get_or_fetch(
+        key,
+        lambda: upstream_flight.do(key, lambda: fetch_news_upstream(
+            query=query, sources=sources, published_from=published_from
+        ))
+    )
+
+async def fetch_news_upstream(query: str = None, sources: str = None,
+                              published_from: Optional[str] = None, page: int = 1,
+                              priority: str = "interactive") -> List[Dict]:
+    """Call NewsAPI directly, raising on any transport or HTTP error
+
+    Each call spends one request from upstream_limiter at `priority`
+    ("ingest" for polls), raising QuotaExceeded when it is refused, and
+    fails fast with CircuitOpen while upstream_breaker is open. Successful
+    batches are merged into the last-good snapshot.
+    """
+    client = get_http_client()
+    params = {
+        "apiKey": NEWS_API_KEY,
+        "language": "en",
+        "sortBy": "publishedAt",
+        "pageSize": NEWSAPI_PAGE_SIZE
+    }
+    if page > 1:
+        params["page"] = page
+    
+    if query:
+        params["q"] = query
+        endpoint = f"{NEWS_API_URL}/everything"
+        if published_from:
+            params["from"] = published_from
+    else:
+        params["category"] = "politics"
+        endpoint = f"{NEWS_API_URL}/top-headlines"
+    
+    if sources:
+        params["sources"] = sources
+    
+    async with upstream_breaker:
+        await upstream_limiter.acquire(priority)
+        start = time.perf_counter()
         try:
-            params = {
-                "apiKey": NEWS_API_KEY,
-                "language": "en",
-                "sortBy": "publishedAt",
-                "pageSize": 100
-            }
-            
-            if query:
-                params["q"] = query
-                endpoint = f"{NEWS_API_URL}/everything"
-            else:
-                params["category"] = "politics"
-                endpoint = f"{NEWS_API_URL}/top-headlines"
-            
-            if sources:
-                params["sources"] = sources
-            
             response = await client.get(endpoint, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            return data.get("articles", [])
-            
-        except Exception as e:
-            logger.error(f"Error fetching news: {e}")
-            return generate_mock_news()
+        except httpx.HTTPError as e:
+            UPSTREAM_REQUESTS.labels(type(e).__name__).inc()
+            raise
+        finally:
+            UPSTREAM_SECONDS.observe(time.perf_counter() - start)
+        UPSTREAM_REQUESTS.labels(response.status_code).inc()
+        if response.status_code == 429 or response.status_code >= 500:
+            raise UpstreamError(
+                response.status_code,
+                retry_after=parse_retry_after(response.headers.get("Retry-After"))
+            )
+        response.raise_for_status()
+    
+    articles = response.json().get("articles", [])
+    article_snapshot.update(articles)
+    await asyncio.to_thread(article_snapshot.save, datetime.now(timezone.utc).isoformat())
+    return articles
 
 def generate_mock_news() -> List[Dict]:
     """Generate mock news data for development"""
@@ -217,17 +614,30 @@ def generate_mock_news() -> List[Dict]:
     ]
     return mock_articles
 
-def analyze_bias(text: str) -> str:
-    """Simple bias detection (would use ML model in production)"""
-    if not text:
-        return "unknown"
-    
-    # Simplified bias detection logic
-    emotional_words = ["shocking", "devastating", "incredible", "amazing", "terrible"]
-    text_lower = text.lower()
-    
-    emotional_count = sum(1 for word in emotional_words if word in text_lower)
-    
+# Single precompiled matcher shared by all analyzers
+article_matcher = KeywordMatcher({
+    "emotional": EMOTIONAL_WORDS,
+    "positive": POSITIVE_WORDS,
+    "negative": NEGATIVE_WORDS,
+    "topics": TOPIC_KEYWORDS,
+})
+
+# Region detection for WebSocket channel routing
+region_matcher = KeywordMatcher({
+    region: terms.split(" OR ") for region, terms in REGION_MAP.items()
+})
+
+def article_channels(article: Dict) -> List[str]:
+    """WebSocket channels a stored article (payload dict) is published to"""
+    channels = [f"topic:{topic.lower()}" for topic in article.get("topics", [])]
+    regions = region_matcher.scan(f"{article.get('title') or ''} {article.get('description') or ''}")
+    channels.extend(f"region:{region}" for region, hits in regions.items() if hits)
+    if article.get("biasLevel"):
+        channels.append(f"bias:{article['biasLevel']}")
+    channels.append(f"source:{(article.get('source') or 'Unknown').lower()}")
+    return channels
+
+def classify_bias(emotional_count: int) -> str:
     if emotional_count >= 3:
         return "high"
     elif emotional_count >= 1:
@@ -235,18 +645,7 @@ def analyze_bias(text: str) -> str:
     else:
         return "low"
 
-def analyze_sentiment(text: str) -> str:
-    """Simple sentiment analysis (would use ML model in production)"""
-    if not text:
-        return "neutral"
-    
-    positive_words = ["agreement", "success", "progress", "improvement", "cooperation"]
-    negative_words = ["conflict", "crisis", "failure", "tension", "dispute"]
-    
-    text_lower = text.lower()
-    positive_count = sum(1 for word in positive_words if word in text_lower)
-    negative_count = sum(1 for word in negative_words if word in text_lower)
-    
+def classify_sentiment(positive_count: int, negative_count: int) -> str:
     if positive_count > negative_count:
         return "positive"
     elif negative_count > positive_count:
@@ -254,32 +653,61 @@ def analyze_sentiment(text: str) -> str:
     else:
         return "neutral"
 
-def process_article(article: Dict) -> NewsArticle:
+def analyze_text(text: str) -> Dict[str, Any]:
+    """Bias, sentiment and topics from one scan of the text"""
+    hits = article_matcher.scan(text)
+    return {
+        "biasLevel": classify_bias(len(hits["emotional"])) if text else "unknown",
+        "sentiment": classify_sentiment(len(hits["positive"]), len(hits["negative"])),
+        "topics": [keyword for keyword in TOPIC_KEYWORDS if keyword in hits["topics"]],
+    }
+
+def analyze_bias(text: str) -> str:
+    """Simple bias detection (would use ML model in production)"""
+    if not text:
+        return "unknown"
+    return classify_bias(len(article_matcher.scan(text)["emotional"]))
+
+def analyze_sentiment(text: str) -> str:
+    """Simple sentiment analysis (would use ML model in production)"""
+    if not text:
+        return "neutral"
+    hits = article_matcher.scan(text)
+    return classify_sentiment(len(hits["positive"]), len(hits["negative"]))
+
+def parse_published_at(value: Any) -> datetime:
+    """Parse a NewsAPI publishedAt value (ISO string with optional Z)"""
+    if value is None:
+        return datetime.now()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value
+
+@timed(STAGE_SECONDS.labels("process_article"))
+def process_article(article: Dict, now: Optional[datetime] = None) -> NewsArticle:
     """Process raw article data into NewsArticle model"""
-    # Generate unique ID
-    article_id = str(hash(article.get("url", "")))
+    # Stable content-addressed ID (same on every worker and across restarts)
+    article_id = article_id_for(article.get("url", ""))
     
     # Extract and process content
     title = article.get("title", "")
     description = article.get("description", "")
     content = article.get("content", "")
     
-    # Analyze article
+    # Analyze article (bias, sentiment and topics in a single pass)
     combined_text = f"{title} {description} {content}"
-    bias_level = analyze_bias(combined_text)
-    sentiment = analyze_sentiment(combined_text)
+    start = time.perf_counter()
+    analysis = analyze_text(combined_text)
+    ANALYZE_SECONDS.observe(time.perf_counter() - start)
     
-    # Determine if it's breaking news (published within last hour)
-    published_at = article.get("publishedAt", datetime.now().isoformat())
-    if isinstance(published_at, str):
-        published_at = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
-    is_breaking = (datetime.now() - published_at.replace(tzinfo=None)) < timedelta(hours=1)
+    # Determine if it's breaking news (published within last hour); the store
+    # recomputes this on every read, since the stored flag goes stale
+    published_at = parse_published_at(article.get("publishedAt"))
+    age = (now or datetime.now()) - published_at.replace(tzinfo=None)
+    is_breaking = age < timedelta(seconds=BREAKING_SECONDS)
     
-    # Extract topics from content
-    topics = []
-    for keyword in POLITICS_KEYWORDS[:10]:
-        if keyword.lower() in combined_text.lower():
-            topics.append(keyword)
+    # Mock scores are seeded by the ID so reprocessing yields the same payload
+    scores = random.Random(article_id)
     
     return NewsArticle(
         id=article_id,
@@ -291,36 +719,457 @@ def process_article(article: Dict) -> NewsArticle:
         source=article.get("source", {}).get("name", "Unknown"),
         author=article.get("author"),
         publishedAt=published_at,
-        topics=topics[:5],  # Limit to 5 topics
-        biasLevel=bias_level,
-        sentiment=sentiment,
-        confidence=random.uniform(0.7, 0.95),  # Mock confidence score
-        verified=article.get("source", {}).get("name") in [s.replace("-", " ").title() for s in TRUSTED_SOURCES],
+        topics=analysis["topics"][:5],  # Limit to 5 topics
+        biasLevel=analysis["biasLevel"],
+        sentiment=analysis["sentiment"],
+        confidence=scores.uniform(0.7, 0.95),  # Mock confidence score
+        verified=article.get("source", {}).get("name") in TRUSTED_SOURCE_NAMES,
         breaking=is_breaking,
-        factCheckStatus="verified" if random.random() > 0.5 else "unverified"
+        factCheckStatus="verified" if scores.random() > 0.5 else "unverified"
     )
 
-async def fetch_news_periodically():
-    """Background task to fetch news periodically"""
-    while True:
-        try:
-            # Fetch latest politics news
-            articles = await fetch_news_from_api(query="politics OR government OR election")
-            
-            # Process and broadcast new articles
-            for article in articles[:5]:  # Limit to 5 articles per update
-                processed = process_article(article)
-                await manager.broadcast({
-                    "type": "new_article",
-                    "article": processed.dict()
-                })
-            
-            # Wait before next fetch
-            await asyncio.sleep(300)  # Fetch every 5 minutes
-            
-        except Exception as e:
-            logger.error(f"Error in periodic news fetch: {e}")
-            await asyncio.sleep(60)
+def process_article_chunk(articles: List[Dict]) -> List[NewsArticle]:
+    """Process a chunk of raw articles (runs inside executor workers)"""
+    now = datetime.now()
+    return [process_article(article, now=now) for article in articles]
+
+@timed(STAGE_SECONDS.labels("process_batch"))
+async def process_articles(articles: List[Dict]) -> List[NewsArticle]:
+    """Process a batch of raw articles without blocking the event loop
+
+    The batch is split into PROCESS_CHUNK_SIZE chunks that run concurrently on
+    the processing executor. Without an executor, chunks run inline and the
+    loop is yielded between them so other clients are served meanwhile.
+    """
+    if not articles:
+        return []
+    
+    chunks = [
+        articles[i:i + PROCESS_CHUNK_SIZE]
+        for i in range(0, len(articles), PROCESS_CHUNK_SIZE)
+    ]
+    
+    if processing_executor is None:
+        processed = []
+        for chunk in chunks:
+            processed.extend(process_article_chunk(chunk))
+            await asyncio.sleep(0)
+        return processed
+    
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(*(
+        loop.run_in_executor(processing_executor, process_article_chunk, chunk)
+        for chunk in chunks
+    ))
+    return [article for chunk in results for article in chunk]
+
+async def compute_signatures(articles: List[NewsArticle]) -> List[Any]:
+    """MinHash signatures for a batch, computed on the processing executor"""
+    texts = [f"{a.title} {a.description or ''}" for a in articles]
+    if processing_executor is None:
+        return story_clusterer.hasher.signatures(texts)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(processing_executor, story_clusterer.hasher.signatures, texts)
+
+@timed(STAGE_SECONDS.labels("cluster"))
+async def cluster_articles(articles: List[NewsArticle]) -> List[NewsArticle]:
+    """Collapse near-duplicate stories into their canonical articles
+
+    Returns only canonical articles, each carrying its cluster's alternate
+    sources. Alternates for canonicals stored by earlier batches are written
+    straight to the article store.
+    """
+    if not articles:
+        return []
+    
+    signatures = await compute_signatures(articles)
+    canonical = []
+    touched = {}
+    for article, signature in zip(articles, signatures):
+        cluster = story_clusterer.add(article.id, signature, source=article.source, url=article.url)
+        article.clusterId = cluster.cluster_id
+        if cluster.cluster_id == article.id:
+            canonical.append(article)
+        else:
+            touched[cluster.cluster_id] = cluster
+    
+    for article in canonical:
+        article.alternateSources = list(story_clusterer.clusters[article.id].alternates)
+        touched.pop(article.id, None)
+    
+    await asyncio.to_thread(article_store.set_alternate_sources, {
+        cluster_id: list(cluster.alternates) for cluster_id, cluster in touched.items()
+    })
+    return canonical
+
+async def warm_indexes():
+    """Rebuild the in-memory LSH and search indexes from the article store"""
+    stored = await asyncio.to_thread(
+        article_store.recent, max(DEDUPE_MAX_ITEMS, SEARCH_INDEX_MAX_DOCS)
+    )
+    # Oldest first so eviction order matches ingestion order
+    for payload in reversed(stored[:SEARCH_INDEX_MAX_DOCS]):
+        index_article(payload)
+    
+    # Stored articles count towards the live stats and were already
+    # available to clients, so they are not pushed again unless they change
+    for payload in stored:
+        record_article_activity(payload)
+    for payload in reversed(stored[:WS_SEEN_MAX]):
+        seen_articles.mark(payload["id"], payload_fingerprint(payload))
+    
+    stored = stored[:DEDUPE_MAX_ITEMS]
+    texts = [f"{a['title']} {a.get('description') or ''}" for a in stored]
+    signatures = await asyncio.to_thread(story_clusterer.hasher.signatures, texts)
+    for payload, signature in reversed(list(zip(stored, signatures))):
+        restore_cluster(payload, signature)
+
+def restore_cluster(article: Dict, signature: Any):
+    """Add a stored canonical article and its known alternates to the LSH index"""
+    cluster = story_clusterer.add(article["id"], signature)
+    for alternate in article.get("alternateSources", []):
+        if alternate["id"] not in cluster.members:
+            cluster.members.append(alternate["id"])
+            cluster.alternates.append(alternate)
+
+def record_article_activity(article: Dict):
+    """Count a stored article (payload dict) in the live stats and trending sketch"""
+    published_ts = parse_published_at(article.get("publishedAt")).timestamp()
+    article_stats.record(
+        published_ts,
+        article.get("biasLevel"),
+        bool(article.get("verified")),
+        article.get("source")
+    )
+    terms = extract_entities(f"{article.get('title') or ''}. {article.get('description') or ''}")
+    terms.update(article.get("topics", []))
+    trending_tracker.add_many(terms, at=published_ts)
+
+def absorb_article(article: Dict):
+    """Index a stored article that another worker (or request) ingested"""
+    if article["id"] not in search_index:
+        index_article(article)
+    if story_clusterer.cluster_of(article["id"]) is None:
+        text = f"{article['title']} {article.get('description') or ''}"
+        restore_cluster(article, story_clusterer.hasher.signature(text))
+
+def index_article(article: Dict):
+    """Add a stored article (payload dict) to the local search index"""
+    search_index.add(
+        article["id"],
+        article.get("title") or "",
+        f"{article.get('description') or ''} {article.get('content') or ''}"
+    )
+
+def article_text(article: Dict) -> str:
+    """Searchable text of a raw article, as stored in the search_text column"""
+    return " ".join(article.get(field) or "" for field in ("title", "description", "content"))
+
+@timed(STAGE_SECONDS.labels("ingest"))
+async def ingest_articles(articles: List[Dict], stream: Optional[str] = None) -> List[NewsArticle]:
+    """Process raw articles and upsert them into the article store
+
+    When `stream` is given only articles at or after that stream's publishedAt
+    high-water mark are processed, so each poll handles just the new items.
+    Returns the articles that were new or whose content changed.
+    """
+    if stream:
+        high_water_mark = await asyncio.to_thread(article_store.high_water_mark, stream)
+        articles = [
+            a for a in articles
+            if parse_published_at(a.get("publishedAt")).timestamp() >= high_water_mark
+        ]
+    if not articles:
+        return []
+    
+    processed = await process_articles(articles)
+    newest = max(a.publishedAt.timestamp() for a in processed)
+    processed = await cluster_articles(processed)
+    records = []
+    for article in processed:
+        record = article.model_dump(mode="json")
+        record["published_ts"] = article.publishedAt.timestamp()
+        records.append(record)
+        index_article(record)
+    
+    changes = await asyncio.to_thread(article_store.upsert_many, records)
+    if stream:
+        await asyncio.to_thread(article_store.set_high_water_mark, stream, newest)
+    
+    changed = []
+    for article in processed:
+        if changes.pop(article.id, None) is not None:
+            changed.append(article)
+    return changed
+
+def refill_due(key: Tuple[str, str, str]) -> bool:
+    """Whether a sparse read may refill the store from `key` (see store_refills)"""
+    return time.monotonic() - store_refills.get(key, float("-inf")) >= CACHE_TTL_SECONDS
+
+def mark_refilled(key: Tuple[str, str, str]):
+    now = time.monotonic()
+    for stale in [k for k, t in store_refills.items() if now - t >= CACHE_TTL_SECONDS]:
+        del store_refills[stale]
+    store_refills[key] = now
+
+async def read_or_ingest(query: str, limit: int, after: Optional[Any] = None,
+                         since_ts: Optional[float] = None,
+                         **filters) -> Optional[Tuple[List[str], Optional[Any]]]:
+    """Read a page of matching articles (stored JSON text) from the store
+
+    The first page refills the store from NewsAPI when it is sparse, at
+    most once per query per CACHE_TTL_SECONDS (see store_refills); later
+    pages (`after` set) are served locally. Returns (rows, next page key),
+    or None only when nothing is stored and the upstream is unavailable.
+    """
+    filters["since_ts"] = since_ts
+    start = time.perf_counter()
+    rows, next_key = await asyncio.to_thread(
+        article_store.page, limit=limit, after=after, raw=True, **filters
+    )
+    STAGE_SECONDS.labels("store_page").observe(time.perf_counter() - start)
+    if after is not None or len(rows) >= min(limit, STORE_MIN_RESULTS):
+        return rows, next_key
+    
+    published_from = upstream_from(since_ts)
+    key = make_query_key(query, None, published_from)
+    if not refill_due(key):
+        return rows, next_key
+    try:
+        await ingest_articles(await fetch_news_from_api(
+            query=query, published_from=published_from
+        ))
+    except Exception as e:
+        logger.warning(f"Upstream refill failed, serving {len(rows)} stored articles: {e}")
+        return (rows, next_key) if rows else None
+    mark_refilled(key)
+    return await asyncio.to_thread(article_store.page, limit=limit, raw=True, **filters)
+
+def parse_time_range(value: str) -> Optional[float]:
+    """Seconds covered by a timeRange such as "1h", "24h", "7d" or "2w" ("all" -> None)"""
+    value = value.strip().lower()
+    if value == "all":
+        return None
+    match = re.fullmatch(r"(\d+)([hdw])", value)
+    if not match:
+        raise HTTPException(status_code=400, detail="Invalid timeRange")
+    return int(match.group(1)) * {"h": 3600, "d": 86400, "w": 604800}[match.group(2)]
+
+def upstream_from(since_ts: Optional[float]) -> Optional[str]:
+    """NewsAPI `from` value for a lower time bound, floored to 10 minutes so
+    requests within the same window share a cache entry"""
+    if since_ts is None:
+        return None
+    floored = since_ts - since_ts % 600
+    return datetime.fromtimestamp(floored, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+def etag_response(request: Request, content: Dict[str, Any], rows: Optional[List[str]] = None) -> Response:
+    """JSON response with a strong ETag, or 304 Not Modified when If-None-Match is current
+
+    For pages served from the store, pass the stored article JSON as `rows`:
+    the tag is hashed from those strings and the other response fields, so a
+    revalidation is answered without serializing the articles at all.
+    """
+    body = None
+    if rows is None:
+        body = dumps(content)
+        digest = hashlib.blake2b(body, digest_size=16)
+    else:
+        digest = hashlib.blake2b(dumps({k: v for k, v in content.items() if k != "articles"}), digest_size=16)
+        for row in rows:
+            digest.update(b"\x1e")
+            digest.update(row.encode())
+    etag = f'"{digest.hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if body is None:
+        return FastJSONResponse(content, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+def page_limit(limit: int) -> int:
+    """Clamp a requested page size to 1..MAX_PAGE_LIMIT"""
+    return min(max(limit, 1), MAX_PAGE_LIMIT)
+
+def page_after(cursor: Optional[str]) -> Optional[Any]:
+    """Decode a client cursor, rejecting malformed ones with a 400"""
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def article_message(cursor: int, article: Any, status: str = "new") -> Dict:
+    """WebSocket payload for a stored article (dict or RawJSON) at a given store cursor"""
+    return {
+        "type": "new_article" if status == "new" else "article_updated",
+        "cursor": cursor,
+        "article": article
+    }
+
+@timed(STAGE_SECONDS.labels("publish"))
+async def publish_changes() -> int:
+    """Push store changes since the last publish to matching subscribers
+
+    Walks the store's change log from `push_cursor`, so articles stored by
+    REST refills are pushed too, and skips anything the seen-set says
+    clients already have. Returns the number of articles pushed.
+    """
+    pushed = 0
+    async with publish_lock:  # poll streams publish concurrently
+        while True:
+            start = push_cursor
+            changes = await asyncio.to_thread(article_store.since, start, WS_RESUME_MAX)
+            if changes and coordinator is not None:
+                coordinator.relay({"type": "changes", "from": start, "changes": changes})
+            pushed += await deliver_changes(changes)
+            if len(changes) < WS_RESUME_MAX:
+                return pushed
+
+async def deliver_changes(changes: List[Any]) -> int:
+    """Index and push (seq, fingerprint, JSON text) store changes; callers hold publish_lock"""
+    global push_cursor
+    pushed = 0
+    for cursor, fingerprint, payload in changes:
+        push_cursor = cursor
+        article = loads(payload)
+        absorb_article(article)
+        status = seen_articles.mark(article["id"], fingerprint)
+        if status is None:
+            continue
+        if status == "new":
+            record_article_activity(article)
+        # The stored JSON text is spliced into the message, not re-encoded
+        await manager.publish(
+            article_message(cursor, RawJSON(payload), status),
+            article_channels(article), key=f"article:{article['id']}"
+        )
+        pushed += 1
+    return pushed
+
+async def apply_relayed(message: Dict):
+    """Follower side of the worker relay: push the leader's changes locally
+
+    Batches that continue from this worker's cursor are applied as-is; on
+    any gap (first connect, leader change, dropped relay) the worker
+    catches up from the shared store instead.
+    """
+    if message.get("type") == "changes":
+        async with publish_lock:
+            if message.get("from") == push_cursor:
+                await deliver_changes(message["changes"])
+                return
+    await publish_changes()
+
+async def start_polling():
+    """Start the poll scheduler once this worker is elected leader"""
+    global poll_scheduler
+    poll_scheduler = create_poll_scheduler()
+    poll_scheduler.start()
+
+async def poll_stream(stream: PollStream) -> int:
+    """Fetch one poll stream, store and push what is new; returns the new article count
+
+    Polls bypass stale cache entries so upstream errors (and Retry-After)
+    reach the scheduler, then refresh the cache for REST readers.
+    """
+    key = make_query_key(stream.query, None)
+    articles = await upstream_flight.do(key, lambda: fetch_news_upstream(query=stream.query, priority="ingest"))
+    news_cache.set(key, articles)
+    changed = await ingest_articles(articles, stream=stream.name)
+    if changed:
+        logger.info(f"Stream {stream.name}: stored {len(changed)} new or updated articles")
+    
+    # Publish only articles clients have not received yet
+    pushed = await publish_changes()
+    if pushed:
+        logger.info(f"Pushed {pushed} articles to WebSocket subscribers")
+    return len(changed)
+
+async def poll_shards(stream: PollStream) -> int:
+    """Fetch every ingest shard concurrently, merge, store and push; returns the new article count
+
+    Each shard keeps its own publishedAt high-water mark, so a quiet source
+    never hides older-but-unseen articles from a busier one. A 429 on any
+    shard (or every shard failing) is raised after storing what did arrive,
+    so the scheduler still backs off.
+    """
+    results, errors = await shard_fetcher.fetch(ingest_shards)
+    
+    batches = []
+    newest = {}
+    for name, articles in results.items():
+        mark = await asyncio.to_thread(article_store.high_water_mark, f"shard:{name}")
+        fresh = []
+        for article in articles:
+            published = parse_published_at(article.get("publishedAt")).timestamp()
+            if published >= mark:
+                fresh.append(article)
+                newest[name] = max(newest.get(name, published), published)
+        batches.append(fresh)
+    merged = merge_newest_first(
+        batches,
+        identity=lambda a: article_id_for(a.get("url", "")),
+        published=lambda a: parse_published_at(a.get("publishedAt")).timestamp(),
+    )
+    
+    changed = await ingest_articles(merged)
+    for name, published in newest.items():
+        await asyncio.to_thread(article_store.set_high_water_mark, f"shard:{name}", published)
+    if changed:
+        logger.info(f"Sharded ingest: {len(merged)} articles from {len(results)} shards, "
+                    f"stored {len(changed)} new or updated in {shard_fetcher.last_duration:.2f}s")
+    
+    pushed = await publish_changes()
+    if pushed:
+        logger.info(f"Pushed {pushed} articles to WebSocket subscribers")
+    
+    for name, error in errors.items():
+        logger.warning(f"Shard {name} failed: {error}")
+    rate_limited = [e for e in errors.values() if isinstance(e, UpstreamError) and e.status == 429]
+    if rate_limited:
+        raise rate_limited[0]
+    if errors and len(errors) == len(results):
+        raise next(iter(errors.values()))
+    return len(changed)
+
+def create_poll_scheduler() -> PollScheduler:
+    """Poll scheduler with the politics stream plus any POLL_REGIONS streams
+
+    With INGEST_MODE=sharded it runs a single stream that fetches every
+    ingest shard concurrently instead.
+    """
+    sharded = INGEST_MODE == "sharded"
+    scheduler = PollScheduler(
+        poll_shards if sharded else poll_stream,
+        request_quota,
+        min_interval=POLL_MIN_INTERVAL,
+        max_interval=POLL_MAX_INTERVAL,
+        target_batch=POLL_TARGET_BATCH,
+        quota_share=POLL_QUOTA_SHARE,
+        backoff_base=POLL_BACKOFF_BASE,
+        backoff_max=POLL_BACKOFF_MAX,
+    )
+    if sharded:
+        # Each shard pages up to INGEST_MAX_PAGES, so budget the worst case
+        scheduler.add_stream(
+            "sharded", f"{len(ingest_shards)} shards of {POLL_QUERY}", interval=600,
+            cost=len(ingest_shards) * INGEST_MAX_PAGES
+        )
+        return scheduler
+    
+    scheduler.add_stream("politics", POLL_QUERY, interval=300)
+    
+    regions = list(REGION_MAP) if POLL_REGIONS.strip() == "all" else [
+        r.strip() for r in POLL_REGIONS.split(",") if r.strip()
+    ]
+    for region in regions:
+        if region not in REGION_MAP:
+            logger.warning(f"Ignoring unknown poll region: {region}")
+            continue
+        scheduler.add_stream(f"region:{region}", f"({POLL_QUERY}) AND ({REGION_MAP[region]})", interval=600)
+    return scheduler
 
 # API Endpoints
 @app.get("/")
@@ -334,61 +1183,80 @@ async def root():
             "news": "/api/v1/news/politics",
             "search": "/api/v1/news/search",
             "analysis": "/api/v1/analysis/article/{id}",
-            "websocket": "/ws"
+            "websocket": "/ws",
+            "metrics": "/metrics"
         }
     }
 
 @app.get("/api/v1/news/politics")
 async def get_politics_news(
+    request: Request,
     region: str = Query("all", description="Filter by region"),
     topic: str = Query("all", description="Filter by topic"),
-    timeRange: str = Query("24h", description="Time range filter"),
+    timeRange: str = Query("24h", description="Time range filter: 1h, 24h, 7d, 30d ... or all"),
     biasLevel: str = Query("all", description="Filter by bias level"),
     verified: bool = Query(False, description="Only verified sources"),
-    limit: int = Query(50, description="Maximum number of articles")
+    limit: int = Query(50, description=f"Maximum number of articles (at most {MAX_PAGE_LIMIT})"),
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page")
 ):
     """Get latest global politics news"""
+    limit = page_limit(limit)
+    after = page_after(cursor)
+    window = parse_time_range(timeRange)
+    since_ts = datetime.now().timestamp() - window if window else None
     try:
         # Build query based on filters
         query_parts = ["politics"]
+        match_all = []
         
         if topic != "all":
             query_parts.append(topic)
+            match_all.append([topic])
         
         if region != "all":
-            region_map = {
-                "north-america": "USA OR Canada OR Mexico",
-                "europe": "EU OR UK OR Germany OR France",
-                "asia": "China OR Japan OR India OR Korea",
-                "middle-east": "Middle East OR Saudi OR Iran OR Israel",
-                "africa": "Africa OR Nigeria OR Egypt OR South Africa",
-                "latin-america": "Brazil OR Argentina OR Mexico",
-                "oceania": "Australia OR New Zealand"
-            }
-            if region in region_map:
-                query_parts.append(f"({region_map[region]})")
+            if region in REGION_MAP:
+                query_parts.append(f"({REGION_MAP[region]})")
+                match_all.append(REGION_MAP[region].split(" OR "))
         
         query = " AND ".join(query_parts)
         
-        # Fetch news
-        articles = await fetch_news_from_api(query=query)
+        # Serve a page from the article store, refilling from NewsAPI when sparse
+        page = await read_or_ingest(
+            query,
+            limit,
+            after=after,
+            since_ts=since_ts,
+            match_all=match_all,
+            bias_level=None if biasLevel == "all" else biasLevel,
+            verified_only=verified
+        )
         
-        # Process articles
-        processed_articles = []
-        for article in articles[:limit]:
-            processed = process_article(article)
-            
-            # Apply filters
-            if biasLevel != "all" and processed.biasLevel != biasLevel:
-                continue
-            if verified and not processed.verified:
-                continue
-            
-            processed_articles.append(processed)
+        next_key = None
+        rows = None
+        if page is None:
+            # Nothing stored and upstream unavailable - serve the last-good snapshot
+            patterns = [re.compile(terms_pattern(group), re.IGNORECASE) for group in match_all]
+            candidates = [
+                article for article in article_snapshot.articles()
+                if all(pattern.search(article_text(article)) for pattern in patterns)
+            ]
+            processed_articles = [
+                processed.model_dump(mode="json")
+                for processed in await process_articles(candidates)
+                if (biasLevel == "all" or processed.biasLevel == biasLevel)
+                and (not verified or processed.verified)
+                and not (since_ts and processed.publishedAt.timestamp() < since_ts)
+            ][:limit]
+        else:
+            # Stored articles are already JSON; splice them into the response
+            rows, next_key = page
+            processed_articles = raw_list(rows)
         
-        return {
-            "articles": [a.dict() for a in processed_articles],
+        return etag_response(request, {
+            "articles": processed_articles,
             "total": len(processed_articles),
+            "limit": limit,
+            "nextCursor": encode_cursor(next_key) if next_key else None,
             "filters": {
                 "region": region,
                 "topic": topic,
@@ -396,19 +1264,34 @@ async def get_politics_news(
                 "biasLevel": biasLevel,
                 "verified": verified
             }
-        }
+        }, rows)
         
     except Exception as e:
         logger.error(f"Error fetching politics news: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@timed(STAGE_SECONDS.labels("search"))
+async def search_local(q: str, limit: int, after: Optional[Any] = None) -> Tuple[List[str], Optional[Any]]:
+    """A page of BM25-ranked articles (stored JSON text) plus the next (score, id) key"""
+    hits = search_index.search(q, limit + 1, after=after)
+    next_key = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        next_key = (hits[-1][1], hits[-1][0])
+    rows = await asyncio.to_thread(article_store.get_many, [doc_id for doc_id, _ in hits], True)
+    return rows, next_key
+
 @app.get("/api/v1/news/search")
 async def search_news(
+    request: Request,
     q: str = Query(..., description="Search query"),
     category: str = Query("politics", description="News category"),
-    limit: int = Query(50, description="Maximum number of articles")
+    limit: int = Query(50, description=f"Maximum number of articles (at most {MAX_PAGE_LIMIT})"),
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page")
 ):
     """Search news articles"""
+    limit = page_limit(limit)
+    after = page_after(cursor)
     try:
         # Add politics context to search
         if category == "politics":
@@ -416,14 +1299,40 @@ async def search_news(
         else:
             query = q
         
-        articles = await fetch_news_from_api(query=query)
-        processed_articles = [process_article(a) for a in articles[:limit]]
+        processed_articles, next_key = await search_local(q, limit, after)
+        refill_key = make_query_key(query)
+        if (after is None and len(processed_articles) < min(limit, SEARCH_MIN_HITS)
+                and refill_due(refill_key)):
+            # Too few local hits - pull matching articles from NewsAPI (once per cache TTL)
+            try:
+                await ingest_articles(await fetch_news_from_api(query=query))
+                mark_refilled(refill_key)
+                processed_articles, next_key = await search_local(q, limit)
+            except Exception as e:
+                logger.warning(f"Upstream search failed, serving {len(processed_articles)} local hits: {e}")
+                processed_articles = processed_articles or None
+        
+        rows = processed_articles
+        if rows is None:
+            # Upstream unavailable - match whole tokens against the last-good snapshot
+            terms = set(tokenize(q))
+            candidates = [
+                article for article in article_snapshot.articles()
+                if terms.intersection(tokenize(article_text(article)))
+            ][:limit]
+            processed_articles = [
+                processed.model_dump(mode="json") for processed in await process_articles(candidates)
+            ]
+        else:
+            processed_articles = raw_list(rows)
         
-        return {
-            "articles": [a.dict() for a in processed_articles],
+        return etag_response(request, {
+            "articles": processed_articles,
             "total": len(processed_articles),
+            "limit": limit,
+            "nextCursor": encode_cursor(next_key) if next_key else None,
             "query": q
-        }
+        }, rows)
         
     except Exception as e:
         logger.error(f"Error searching news: {e}")
@@ -452,47 +1361,89 @@ async def analyze_article(article_id: str):
 
 @app.get("/api/v1/stats/realtime")
 async def get_realtime_stats():
-    """Get real-time statistics"""
+    """Get real-time statistics (articles published in the last 24 hours)"""
+    day = article_stats.window("24h")
     return {
-        "totalArticles": random.randint(1000, 5000),
-        "verifiedClaims": random.randint(500, 2000),
-        "lowBias": random.randint(300, 800),
-        "mediumBias": random.randint(200, 500),
-        "highBias": random.randint(50, 200),
-        "sourcesActive": len(TRUSTED_SOURCES),
+        "totalArticles": day["articles"],
+        "verifiedClaims": day["verified"],
+        "lowBias": day["bias"]["low"],
+        "mediumBias": day["bias"]["medium"],
+        "highBias": day["bias"]["high"],
+        "sourcesActive": day["sourcesActive"],
         "lastUpdate": datetime.now().isoformat(),
-        "trending": [
-            "UN Climate Summit",
-            "G20 Economic Policy",
-            "NATO Defense Strategy",
-            "EU Digital Regulation",
-            "Trade Negotiations"
-        ]
+        "trending": [topic["name"] for topic in trending_tracker.top(5)],
+        "windows": {name: article_stats.window(name) for name in ArticleStats.WINDOWS}
+    }
+
+@app.get("/api/v1/stats/cache")
+async def get_cache_stats():
+    """Get upstream response cache statistics"""
+    return {
+        "cache": news_cache.stats(),
+        "singleFlight": upstream_flight.stats(),
+        "searchIndex": search_index.stats(),
+        "trending": trending_tracker.stats(),
+        "polling": poll_scheduler.stats() if poll_scheduler else None,
+        "sharding": shard_fetcher.stats() if INGEST_MODE == "sharded" else None,
+        "upstreamQuota": upstream_limiter.stats(),
+        "upstreamCircuit": upstream_breaker.stats(),
+        "snapshot": article_snapshot.stats(),
+        "worker": coordinator.stats() if coordinator else None,
+        "timestamp": datetime.now().isoformat()
     }
 
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus text-format metrics"""
+    return Response(REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
 @app.get("/api/v1/trending/politics")
-async def get_trending_topics():
-    """Get trending political topics"""
+async def get_trending_topics(limit: int = Query(5, description="Number of topics")):
+    """Get trending political topics (time-decayed mention counts with trend)"""
     return {
-        "topics": [
-            {"name": "Climate Summit", "count": random.randint(100, 500), "trend": "up"},
-            {"name": "Trade Wars", "count": random.randint(80, 400), "trend": "down"},
-            {"name": "Election 2024", "count": random.randint(150, 600), "trend": "up"},
-            {"name": "UN Resolution", "count": random.randint(50, 300), "trend": "neutral"},
-            {"name": "NATO Summit", "count": random.randint(70, 350), "trend": "up"}
-        ],
+        "topics": trending_tracker.top(min(max(limit, 1), TRENDING_CAPACITY)),
         "timestamp": datetime.now().isoformat()
     }
 
+async def resume_client(websocket: WebSocket, cursor: Any):
+    """Replay articles a reconnecting client missed since `cursor`"""
+    if not isinstance(cursor, int) or cursor < 0:
+        manager.send(websocket, {"type": "resume", "status": "invalid_cursor"})
+        return
+    
+    # Never replay past what has been pushed live, so nothing arrives twice
+    missed = await asyncio.to_thread(article_store.since, cursor, WS_RESUME_MAX)
+    complete = len(missed) < WS_RESUME_MAX
+    replayed = 0
+    for seq, _, payload in missed:
+        if seq > push_cursor:
+            complete = True
+            break
+        cursor = seq
+        if manager.wants(websocket, article_channels(loads(payload))):
+            manager.send(websocket, article_message(seq, RawJSON(payload)))
+            replayed += 1
+    if complete:
+        cursor = max(cursor, push_cursor)
+    
+    # A partial resume means the client should resume again from `cursor`
+    manager.send(websocket, {
+        "type": "resume",
+        "status": "complete" if complete else "partial",
+        "cursor": cursor,
+        "replayed": replayed
+    })
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates"""
     await manager.connect(websocket)
     try:
-        # Send initial connection message
-        await websocket.send_json({
+        # Send initial connection message (all sends go through the client's queue)
+        manager.send(websocket, {
             "type": "connection",
             "status": "connected",
+            "cursor": push_cursor,
             "timestamp": datetime.now().isoformat()
         })
         
@@ -504,17 +1455,23 @@ async def websocket_endpoint(websocket: WebSocket):
                 # Handle subscription messages
                 if data:
                     try:
-                        import json
                         message = json.loads(data)
-                        if message.get("type") == "subscribe":
-                            await websocket.send_json({
+                        if message.get("type") in ("subscribe", "unsubscribe"):
+                            # Channels: "politics"/"all" (everything), or
+                            # topic:<name>, region:<key>, bias:<level>, source:<name>
+                            subscribing = message["type"] == "subscribe"
+                            update = manager.subscribe if subscribing else manager.unsubscribe
+                            channel = update(websocket, message.get("channel"))
+                            manager.send(websocket, {
                                 "type": "subscription",
                                 "channel": message.get("channel"),
-                                "status": "subscribed"
+                                "status": ("subscribed" if subscribing else "unsubscribed") if channel else "invalid_channel"
                             })
+                        elif message.get("type") == "resume":
+                            await resume_client(websocket, message.get("cursor"))
                     except json.JSONDecodeError:
                         # Send echo response for non-JSON messages
-                        await websocket.send_text(f"Echo: {data}")
+                        manager.send(websocket, f"Echo: {data}")
             except WebSocketDisconnect:
                 break
             except Exception as e:
@@ -0,0 +1,159 @@
+"""
+In-process response cache for upstream news queries
+TTL + bounded LRU with stale-while-revalidate serving, plus single-flight
+coalescing of identical in-flight upstream requests
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+def make_query_key(query: Optional[str] = None, sources: Optional[str] = None,
+                   published_from: Optional[str] = None) -> Tuple[str, str, str]:
+    """Normalize a query/sources/from triple so equivalent requests share an entry"""
+    # NewsAPI boolean operators are case sensitive, so only whitespace is folded
+    normalized_query = " ".join((query or "").split())
+    normalized_sources = ",".join(sorted(
+        s.strip().lower() for s in (sources or "").split(",") if s.strip()
+    ))
+    return normalized_query, normalized_sources, published_from or ""
+
+class ResponseCache:
+    """TTL cache that keeps serving stale entries while refreshing them
+
+    Entries younger than `ttl` are returned as-is. Entries older than `ttl`
+    but younger than `ttl + stale_ttl` are returned immediately while a
+    single background refresh replaces them. Anything older is a miss.
+    """
+
+    def __init__(self, ttl: float = 60.0, stale_ttl: float = 300.0, max_entries: int = 256):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._refreshing: Set[Hashable] = set()
+        # The loop only holds weak references to tasks; keep refreshes alive
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refresh_errors = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """Return (value, age_seconds) without touching counters"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        return value, time.monotonic() - stored_at
+
+    def set(self, key: Hashable, value: Any):
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Serve from cache when possible, otherwise await `fetch` and store it"""
+        cached = self.get(key)
+        if cached is not None:
+            value, age = cached
+            if age < self.ttl:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return value
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                self._schedule_refresh(key, fetch)
+                return value
+
+        self.misses += 1
+        value = await fetch()
+        self.set(key, value)
+        return value
+
+    def _schedule_refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]):
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        task = asyncio.create_task(self._refresh(key, fetch))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]):
+        try:
+            self.set(key, await fetch())
+        except Exception as e:
+            # Keep serving the stale value; the next request will retry
+            self.refresh_errors += 1
+            logger.warning(f"Background cache refresh failed for {key}: {e}")
+        finally:
+            self._refreshing.discard(key)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "maxEntries": self.max_entries,
+            "ttlSeconds": self.ttl,
+            "staleSeconds": self.stale_ttl,
+            "hits": self.hits,
+            "staleHits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "refreshErrors": self.refresh_errors,
+            "hitRate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one in-flight task
+
+    The first caller for a key starts the work; everyone arriving while it is
+    running awaits the same task instead of issuing a duplicate request.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+        # Shield so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "inFlight": len(self._inflight),
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,152 @@
+"""
+Upstream rate limiting and quota accounting
+Every NewsAPI request passes through one UpstreamLimiter: a token bucket
+smooths bursts, and a daily ledger persisted in the article store keeps
+count across restarts and across workers sharing the store. Ingest polls
+take priority over interactive (REST) refills, which may not dig into the
+share of the day's quota reserved for ingest.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from scheduler import RequestQuota, UpstreamError
+
+PRIORITIES = ("ingest", "interactive")
+
+class QuotaExceeded(UpstreamError):
+    """Request refused locally to protect the rate limit or the daily quota"""
+
+    def __init__(self, reason: str, retry_after: Optional[float] = None):
+        super().__init__(429, retry_after=retry_after, message=f"upstream request refused: {reason}")
+        self.reason = reason
+
+class TokenBucket:
+    """`rate` tokens per second up to a burst of `capacity`"""
+
+    def __init__(self, rate: float, capacity: float, now: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated = now or time.monotonic()
+
+    def _refill(self, now: float):
+        if now > self._updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def try_take(self, count: float = 1, now: Optional[float] = None) -> bool:
+        self._refill(now or time.monotonic())
+        if self.tokens >= count:
+            self.tokens -= count
+            return True
+        return False
+
+    def wait_time(self, count: float = 1, now: Optional[float] = None) -> float:
+        """Seconds until `count` tokens are available"""
+        self._refill(now or time.monotonic())
+        if self.tokens >= count:
+            return 0.0
+        return (count - self.tokens) / self.rate if self.rate > 0 else float("inf")
+
+class QuotaLedger(RequestQuota):
+    """RequestQuota whose per-day count lives in the article store
+
+    `used` is a cached copy of the persisted count, refreshed by `sync()` and
+    by every `record()`, so the scheduler's quota arithmetic also sees
+    requests spent by other workers or before a restart.
+    """
+
+    def __init__(self, daily_limit: int, store, keep_days: int = 7):
+        super().__init__(daily_limit)
+        self.store = store
+        self.keep_days = keep_days
+
+    @staticmethod
+    def _day_key(now: float) -> str:
+        return datetime.fromtimestamp(now, timezone.utc).date().isoformat()
+
+    def _roll(self, now: float):
+        day = datetime.fromtimestamp(now, timezone.utc).date()
+        if day != self._day:
+            self._day = day
+            self.used = self.store.quota_usage(day.isoformat())
+
+    def sync(self, now: Optional[float] = None) -> int:
+        """Reload today's count from the store (blocking; call from a thread)"""
+        now = now or time.time()
+        self._roll(now)
+        self.used = self.store.quota_usage(self._day_key(now))
+        return self.used
+
+    def record(self, count: int = 1, now: Optional[float] = None):
+        """Persist `count` requests against today (blocking; call from a thread)"""
+        now = now or time.time()
+        self._roll(now)
+        oldest = (datetime.fromtimestamp(now, timezone.utc).date() - timedelta(days=self.keep_days)).isoformat()
+        self.used = self.store.add_quota_usage(self._day_key(now), count, prune_before=oldest)
+
+class UpstreamLimiter:
+    """Process-wide gate in front of NewsAPI, with ingest ahead of interactive requests
+
+    Ingest requests wait for a token (up to `max_wait`); interactive ones
+    are refused straight away when no token is free or an ingest request is
+    already waiting. Interactive requests are also refused once the day's
+    remaining quota falls to `ingest_reserve` of the daily limit, keeping
+    that share for polling. Refusals raise QuotaExceeded, a 429-style
+    UpstreamError, so callers fall back exactly as for a real rate limit.
+    """
+
+    def __init__(self, bucket: TokenBucket, quota: QuotaLedger, ingest_reserve: float = 0.5,
+                 max_wait: float = 60.0):
+        self.bucket = bucket
+        self.quota = quota
+        self.ingest_reserve = ingest_reserve
+        self.max_wait = max_wait
+        self.granted = {priority: 0 for priority in PRIORITIES}
+        self.refused = {priority: 0 for priority in PRIORITIES}
+        self._ingest_waiting = 0
+
+    def _refuse(self, priority: str, reason: str, retry_after: Optional[float]) -> QuotaExceeded:
+        self.refused[priority] += 1
+        return QuotaExceeded(reason, retry_after)
+
+    async def acquire(self, priority: str = "interactive"):
+        """Spend one upstream request for `priority`, or raise QuotaExceeded"""
+        if priority not in PRIORITIES:
+            raise ValueError(f"unknown priority: {priority}")
+        await asyncio.to_thread(self.quota.sync)
+        remaining = self.quota.remaining()
+        if remaining < 1:
+            raise self._refuse(priority, "daily quota exhausted", self.quota.seconds_until_reset())
+        if priority == "interactive" and remaining <= self.quota.daily_limit * self.ingest_reserve:
+            raise self._refuse(priority, "remaining quota reserved for ingest", self.quota.seconds_until_reset())
+
+        if priority == "ingest":
+            self._ingest_waiting += 1
+            try:
+                while not self.bucket.try_take():
+                    wait = self.bucket.wait_time()
+                    if wait > self.max_wait:
+                        raise self._refuse(priority, "rate limit", wait)
+                    await asyncio.sleep(wait)
+            finally:
+                self._ingest_waiting -= 1
+        elif self._ingest_waiting or not self.bucket.try_take():
+            raise self._refuse(priority, "rate limit", self.bucket.wait_time() or None)
+
+        self.granted[priority] += 1
+        await asyncio.to_thread(self.quota.record)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.quota.stats(),
+            "ingestReserve": self.ingest_reserve,
+            "tokens": round(self.bucket.tokens, 2),
+            "tokensPerMinute": round(self.bucket.rate * 60, 2),
+            "burst": self.bucket.capacity,
+            "granted": dict(self.granted),
+            "refused": dict(self.refused),
+        }
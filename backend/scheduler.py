@@ -0,0 +1,240 @@
+"""
+Adaptive upstream polling
+Each poll stream (one NewsAPI query) runs on its own cadence, tightened when
+articles arrive quickly and relaxed when they don't, and never faster than
+the remaining daily request quota allows. HTTP 429/5xx responses back off
+exponentially with jitter and honour Retry-After.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class UpstreamError(Exception):
+    """Retryable upstream failure (HTTP 429 or 5xx)"""
+
+    def __init__(self, status: int, retry_after: Optional[float] = None, message: str = ""):
+        super().__init__(message or f"upstream returned HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, when.timestamp() - (now or time.time()))
+
+class RequestQuota:
+    """Upstream requests spent against a daily allowance (resets at UTC midnight)"""
+
+    def __init__(self, daily_limit: int):
+        self.daily_limit = daily_limit
+        self.used = 0
+        self._day = None
+
+    def _roll(self, now: float):
+        day = datetime.fromtimestamp(now, timezone.utc).date()
+        if day != self._day:
+            self._day = day
+            self.used = 0
+
+    def record(self, count: int = 1, now: Optional[float] = None):
+        self._roll(now or time.time())
+        self.used += count
+
+    def remaining(self, now: Optional[float] = None) -> int:
+        self._roll(now or time.time())
+        return max(0, self.daily_limit - self.used)
+
+    def seconds_until_reset(self, now: Optional[float] = None) -> float:
+        now = now or time.time()
+        today = datetime.fromtimestamp(now, timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        return (today + timedelta(days=1)).timestamp() - now
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "dailyLimit": self.daily_limit,
+            "used": self.used,
+            "remaining": self.remaining(),
+            "resetsInSeconds": round(self.seconds_until_reset()),
+        }
+
+class PollStream:
+    """One upstream query polled on its own cadence"""
+
+    def __init__(self, name: str, query: str, interval: float, cost: int = 1):
+        self.name = name
+        self.query = query
+        self.interval = interval
+        self.cost = cost  # upstream requests per poll
+        self.rate: Optional[float] = None  # smoothed new articles per second
+        self.failures = 0
+        self.last_poll: Optional[float] = None
+        self.next_poll = 0.0
+        self.polls = 0
+        self.errors = 0
+        self.articles = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "query": self.query,
+            "intervalSeconds": round(self.interval, 1),
+            "requestsPerPoll": self.cost,
+            "articlesPerHour": round(self.rate * 3600, 1) if self.rate is not None else None,
+            "nextPollInSeconds": max(0, round(self.next_poll - time.time())),
+            "consecutiveFailures": self.failures,
+            "polls": self.polls,
+            "errors": self.errors,
+            "articles": self.articles,
+        }
+
+class PollScheduler:
+    """Runs every PollStream in its own task with an adaptive interval
+
+    `poll(stream)` fetches and ingests one stream and returns how many new
+    articles it found. After a success the next interval aims to collect
+    about `target_batch` new articles at the stream's smoothed arrival rate,
+    clamped to [min_interval, max_interval] and to the quota floor, which
+    spreads `quota_share` of the remaining daily requests over the streams
+    (weighted by each stream's requests per poll) until the quota resets.
+    A 429 pauses every stream, since the rate limit applies to the whole
+    API key.
+    """
+
+    def __init__(
+        self,
+        poll: Callable[[PollStream], Awaitable[int]],
+        quota: RequestQuota,
+        min_interval: float = 60,
+        max_interval: float = 1800,
+        target_batch: int = 20,
+        quota_share: float = 0.8,
+        backoff_base: float = 30,
+        backoff_max: float = 1800,
+        jitter: float = 0.1,
+        smoothing: float = 0.3,
+    ):
+        self.poll = poll
+        self.quota = quota
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_batch = target_batch
+        self.quota_share = quota_share
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.smoothing = smoothing
+        self.streams: Dict[str, PollStream] = {}
+        self.blocked_until = 0.0
+        self._tasks: List[asyncio.Task] = []
+
+    def add_stream(self, name: str, query: str, interval: Optional[float] = None,
+                   cost: int = 1) -> PollStream:
+        interval = interval if interval is not None else self.min_interval
+        stream = PollStream(name, query, min(max(interval, self.min_interval), self.max_interval), cost)
+        self.streams[name] = stream
+        return stream
+
+    def quota_floor(self, now: Optional[float] = None) -> float:
+        """Shortest per-stream interval the remaining quota can sustain"""
+        remaining = self.quota.remaining(now) * self.quota_share
+        reset = self.quota.seconds_until_reset(now)
+        if remaining < 1:
+            return reset
+        return reset * sum(stream.cost for stream in self.streams.values()) / remaining
+
+    def next_interval(self, stream: PollStream, new_articles: int, now: float) -> float:
+        """Update the stream's arrival rate and return its next interval (unjittered)"""
+        if stream.last_poll is not None and now > stream.last_poll:
+            observed = new_articles / (now - stream.last_poll)
+            stream.rate = observed if stream.rate is None else (
+                self.smoothing * observed + (1 - self.smoothing) * stream.rate
+            )
+        stream.last_poll = now
+
+        if stream.rate:
+            interval = self.target_batch / stream.rate
+        elif stream.rate is None:
+            interval = stream.interval
+        else:
+            interval = stream.interval * 1.5  # nothing arriving: relax gradually
+        interval = min(max(interval, self.min_interval), self.max_interval)
+        stream.interval = max(interval, self.quota_floor(now))
+        return stream.interval
+
+    def backoff_delay(self, failures: int, retry_after: Optional[float] = None) -> float:
+        """Exponential backoff with jitter, never shorter than Retry-After"""
+        delay = min(self.backoff_max, self.backoff_base * 2 ** max(0, failures - 1))
+        delay = random.uniform(delay / 2, delay)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def _jittered(self, interval: float) -> float:
+        # Keeps streams with equal intervals from polling in lockstep
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    async def _run(self, stream: PollStream):
+        while True:
+            now = time.time()
+            wait = max(stream.next_poll, self.blocked_until) - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+            if self.quota.remaining(now) < 1:
+                stream.next_poll = now + self._jittered(self.quota.seconds_until_reset(now))
+                logger.warning(f"Request quota exhausted; stream {stream.name} paused until reset")
+                continue
+
+            started = time.time()
+            stream.polls += 1
+            try:
+                new_articles = await self.poll(stream)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                stream.failures += 1
+                stream.errors += 1
+                delay = self.backoff_delay(stream.failures, getattr(e, "retry_after", None))
+                if isinstance(e, UpstreamError) and e.status == 429:
+                    self.blocked_until = max(self.blocked_until, started + delay)
+                stream.next_poll = time.time() + delay
+                logger.warning(f"Poll stream {stream.name} failed ({e}); retrying in {delay:.0f}s")
+                continue
+
+            stream.failures = 0
+            stream.articles += new_articles
+            stream.next_poll = time.time() + self._jittered(self.next_interval(stream, new_articles, started))
+
+    def start(self):
+        for stream in self.streams.values():
+            self._tasks.append(asyncio.create_task(self._run(stream)))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "quota": self.quota.stats(),
+            "quotaFloorSeconds": round(self.quota_floor(), 1),
+            "blockedForSeconds": max(0, round(self.blocked_until - time.time())),
+            "streams": {name: stream.stats() for name, stream in self.streams.items()},
+        }
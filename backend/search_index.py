@@ -0,0 +1,121 @@
+"""
+Local full-text search
+In-memory inverted index with BM25 ranking over ingested articles, updated
+incrementally as new articles are stored.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset("""
+a an and are as at be but by for from has have he her his in into is it its
+of on or that the their they this to was were will with not no after over
+than then there these those who what when where which while said says new
+""".split())
+
+def tokenize(text: str) -> List[str]:
+    return [
+        token for token in _TOKEN_RE.findall((text or "").lower())
+        if token not in STOPWORDS and (len(token) > 1 or token.isdigit())
+    ]
+
+class SearchIndex:
+    """Inverted index (term -> {doc_id: term frequency}) ranked with BM25
+
+    Documents are kept in insertion order and the oldest are dropped once
+    `max_docs` is exceeded, so memory stays bounded.
+
+    Search cursors are self-contained (score, doc_id) keys, so any worker can
+    serve any page. Each page re-ranks the current index and resumes right
+    after the cursor's document wherever it now ranks; BM25 scores shift as
+    the index changes (IDF and average length), so this tracks the previous
+    page better than the raw score, which is only the fallback once that
+    document has left the index. Hits whose relative order changed between
+    pages may still repeat or be skipped.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, max_docs: int = 20000):
+        self.k1 = k1
+        self.b = b
+        self.max_docs = max_docs
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._doc_terms: "OrderedDict[str, Counter]" = OrderedDict()
+        self._doc_lengths: Dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_terms
+
+    def add(self, doc_id: str, title: str, body: str = ""):
+        """Index (or re-index) a document; title terms count double"""
+        if doc_id in self._doc_terms:
+            self.remove(doc_id)
+        tokens = tokenize(title) * 2 + tokenize(body)
+        terms = Counter(tokens)
+        self._doc_terms[doc_id] = terms
+        self._doc_lengths[doc_id] = len(tokens)
+        self._total_length += len(tokens)
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[doc_id] = frequency
+        while len(self._doc_terms) > self.max_docs:
+            self.remove(next(iter(self._doc_terms)))
+
+    def remove(self, doc_id: str):
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+
+    def search(self, query: str, limit: int = 50,
+               after: Optional[Tuple[float, str]] = None) -> List[Tuple[str, float]]:
+        """Top documents for `query` as (doc_id, score), best first
+
+        Ties are broken by doc_id so the order is total; `after` is the
+        (score, doc_id) of the previous page's last hit, re-scored against
+        the current index when that document is still indexed.
+        """
+        terms = set(tokenize(query))
+        doc_count = len(self._doc_terms)
+        if not terms or not doc_count:
+            return []
+        avg_length = self._total_length / doc_count
+        k1, b = self.k1, self.b
+        lengths = self._doc_lengths
+
+        scores: Dict[str, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                norm = k1 * (1 - b + b * lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (k1 + 1) / (frequency + norm)
+
+        items = scores.items()
+        if after is not None:
+            if after[1] in scores:
+                after = (scores[after[1]], after[1])
+            items = [(doc_id, score) for doc_id, score in items if (score, doc_id) < after]
+        return heapq.nlargest(limit, items, key=lambda item: (item[1], item[0]))
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        return {
+            "documents": len(self._doc_terms),
+            "terms": len(self._postings),
+            "avgDocumentLength": round(self._total_length / len(self._doc_terms), 1) if self._doc_terms else None,
+        }
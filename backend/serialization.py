@@ -0,0 +1,91 @@
+"""
+JSON serialization
+Uses orjson when it is installed and falls back to the stdlib otherwise.
+Already-serialized articles are wrapped in RawJSON and spliced into the
+output verbatim, so stored payloads are never decoded and re-encoded just
+to be sent again.
+"""
+
+import json
+import time
+import uuid
+from typing import Any, Dict, List
+
+from fastapi.responses import JSONResponse
+
+from metrics import STAGE_SECONDS
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+_FRAGMENT = getattr(orjson, "Fragment", None)
+
+_RENDER_SECONDS = STAGE_SECONDS.labels("serialize")
+
+class RawJSON:
+    """A pre-serialized JSON value embedded as-is by `dumps`"""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Any):
+        self.data = data.encode() if isinstance(data, str) else data
+
+def _default(value: Any) -> Any:
+    if isinstance(value, RawJSON):
+        return _FRAGMENT(value.data)
+    return str(value)
+
+def _splice(obj: Any, encode) -> bytes:
+    """Encode with placeholders for RawJSON values, then substitute their bytes"""
+    fragments: Dict[bytes, bytes] = {}
+    nonce = uuid.uuid4().hex
+
+    def substitute(value: Any) -> Any:
+        if isinstance(value, RawJSON):
+            token = f"@raw-{nonce}-{len(fragments)}@"
+            fragments[f'"{token}"'.encode()] = value.data
+            return token
+        if isinstance(value, dict):
+            return {k: substitute(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [substitute(v) for v in value]
+        return value
+
+    data = encode(substitute(obj))
+    for token, fragment in fragments.items():
+        data = data.replace(token, fragment, 1)
+    return data
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, default=str, separators=(",", ":"), ensure_ascii=False).encode()
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, splicing any RawJSON values"""
+    if orjson is not None:
+        if _FRAGMENT is not None:
+            return orjson.dumps(obj, default=_default)
+        return _splice(obj, lambda value: orjson.dumps(value, default=str))
+    return _splice(obj, _stdlib_dumps)
+
+def loads(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def raw_list(items: List[Any]) -> List[RawJSON]:
+    return [RawJSON(item) for item in items]
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with `dumps`
+
+    Return it directly from an endpoint to skip FastAPI's jsonable_encoder
+    pass; content may contain RawJSON values.
+    """
+
+    def render(self, content: Any) -> bytes:
+        start = time.perf_counter()
+        body = dumps(content)
+        _RENDER_SECONDS.observe(time.perf_counter() - start)
+        return body
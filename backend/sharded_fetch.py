@@ -0,0 +1,120 @@
+"""
+Sharded upstream fetching
+One refresh is split into independent NewsAPI requests (the trusted sources
+in chunks, plus one query per region) that run concurrently under a
+semaphore. Each shard pages on its own and the results are merged into a
+single deduplicated, newest-first stream, so a refresh takes as long as its
+slowest shard rather than the sum of all of them.
+"""
+
+import asyncio
+import heapq
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+class Shard:
+    """One upstream request family: a query, optionally restricted to some sources"""
+
+    def __init__(self, name: str, query: str, sources: Optional[str] = None):
+        self.name = name
+        self.query = query
+        self.sources = sources
+
+    def __repr__(self) -> str:
+        return f"Shard({self.name!r})"
+
+def build_shards(query: str, sources: List[str], sources_per_shard: int,
+                 regions: Dict[str, str]) -> List[Shard]:
+    """Source shards of `sources_per_shard` outlets each, plus one shard per region query"""
+    shards = []
+    size = max(1, sources_per_shard)
+    for start in range(0, len(sources), size):
+        chunk = sources[start:start + size]
+        shards.append(Shard(f"sources:{start // size}", query, ",".join(chunk)))
+    for region, terms in regions.items():
+        shards.append(Shard(f"region:{region}", f"({query}) AND ({terms})"))
+    return shards
+
+def merge_newest_first(batches: Iterable[List[Dict[str, Any]]], identity: Callable[[Dict[str, Any]], str],
+                       published: Callable[[Dict[str, Any]], float]) -> List[Dict[str, Any]]:
+    """k-way merge of per-shard batches into one newest-first list without duplicates"""
+    ordered = [sorted(batch, key=published, reverse=True) for batch in batches]
+    merged = []
+    seen = set()
+    for article in heapq.merge(*ordered, key=published, reverse=True):
+        key = identity(article)
+        if key in seen:
+            continue
+        seen.add(key)
+        merged.append(article)
+    return merged
+
+class ShardedFetcher:
+    """Fetches every shard concurrently, at most `concurrency` requests in flight
+
+    `fetch_page(shard, page)` returns one page of raw articles. A shard keeps
+    paging until a page comes back short of `page_size` or `max_pages` is
+    reached. A failing page ends only its own shard: the pages it already
+    fetched are kept and the error is reported next to the results.
+    """
+
+    def __init__(self, fetch_page: Callable[[Shard, int], Awaitable[List[Dict[str, Any]]]],
+                 concurrency: int = 4, page_size: int = 100, max_pages: int = 2):
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.requests = 0
+        self.failures = 0
+        self.last_duration: Optional[float] = None
+        self.last_slowest: Optional[Tuple[str, float]] = None
+
+    async def _fetch_shard(self, shard: Shard) -> Tuple[List[Dict[str, Any]], Optional[Exception], float]:
+        started = time.monotonic()
+        articles: List[Dict[str, Any]] = []
+        for page in range(1, self.max_pages + 1):
+            try:
+                # Held per page, so other shards interleave with long paginations
+                async with self._semaphore:
+                    self.requests += 1
+                    batch = await self.fetch_page(shard, page)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                return articles, e, time.monotonic() - started
+            articles.extend(batch)
+            if len(batch) < self.page_size:
+                break
+        return articles, None, time.monotonic() - started
+
+    async def fetch(self, shards: List[Shard]) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Exception]]:
+        """Fetch all shards; returns articles per shard name and errors per shard name"""
+        started = time.monotonic()
+        outcomes = await asyncio.gather(*(self._fetch_shard(shard) for shard in shards))
+        self.last_duration = time.monotonic() - started
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        errors: Dict[str, Exception] = {}
+        slowest = None
+        for shard, (articles, error, elapsed) in zip(shards, outcomes):
+            results[shard.name] = articles
+            if error is not None:
+                errors[shard.name] = error
+            if slowest is None or elapsed > slowest[1]:
+                slowest = (shard.name, elapsed)
+        self.last_slowest = slowest
+        return results, errors
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "pageSize": self.page_size,
+            "maxPages": self.max_pages,
+            "requests": self.requests,
+            "failures": self.failures,
+            "lastRefreshSeconds": round(self.last_duration, 3) if self.last_duration is not None else None,
+            "slowestShard": {"name": self.last_slowest[0], "seconds": round(self.last_slowest[1], 3)}
+            if self.last_slowest else None,
+        }
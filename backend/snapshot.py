@@ -0,0 +1,75 @@
+"""
+Last-good upstream snapshot
+The newest real articles returned by NewsAPI, merged across fetches and
+written to a JSON file, so an outage with an empty or rebuilt article store
+still serves real (if dated) news rather than demo content.
+"""
+
+import logging
+import os
+import tempfile
+from typing import Any, Dict, List
+
+from serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+class ArticleSnapshot:
+    """Up to `max_articles` newest raw upstream articles, persisted at `path`"""
+
+    def __init__(self, path: str, max_articles: int = 500):
+        self.path = path
+        self.max_articles = max_articles
+        self._articles: List[Dict[str, Any]] = []
+        self._dirty = False
+        self.saved_at = None
+
+    def load(self):
+        """Read the snapshot file if there is one (blocking)"""
+        try:
+            with open(self.path, "rb") as f:
+                data = loads(f.read())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable snapshot {self.path}: {e}")
+            return
+        self._articles = data.get("articles", [])[:self.max_articles]
+        self.saved_at = data.get("savedAt")
+        logger.info(f"Loaded {len(self._articles)} snapshot articles from {self.path}")
+
+    def update(self, articles: List[Dict[str, Any]]):
+        """Merge a successful upstream batch, keeping the newest articles by URL"""
+        if not articles:
+            return
+        merged = {a.get("url"): a for a in self._articles}
+        merged.update((a.get("url"), a) for a in articles)
+        newest = sorted(merged.values(), key=lambda a: a.get("publishedAt") or "", reverse=True)
+        self._articles = newest[:self.max_articles]
+        self._dirty = True
+
+    def save(self, saved_at: str):
+        """Write the snapshot atomically if it changed (blocking)"""
+        if not self._dirty:
+            return
+        articles = self._articles
+        self._dirty = False
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".snapshot-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(dumps({"savedAt": saved_at, "articles": articles}))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self._dirty = True
+            logger.warning(f"Could not write snapshot {self.path}: {e}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return
+        self.saved_at = saved_at
+
+    def articles(self) -> List[Dict[str, Any]]:
+        return list(self._articles)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"articles": len(self._articles), "savedAt": self.saved_at, "path": self.path}
@@ -0,0 +1,154 @@
+"""
+Near-duplicate story clustering
+MinHash signatures over title+description shingles, grouped with an LSH
+banding index so syndicated copies of a wire story collapse into a single
+cluster with one canonical article and a list of alternate sources.
+"""
+
+import hashlib
+import random
+import re
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# NewsAPI truncates content with a "[+1234 chars]" marker
+_TRUNCATION_RE = re.compile(r"\[\+\d+ chars\]")
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+Signature = Tuple[int, ...]
+
+class MinHasher:
+    """Deterministic MinHash over word shingles"""
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 3, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def shingles(self, text: str) -> Set[str]:
+        tokens = _TOKEN_RE.findall(_TRUNCATION_RE.sub(" ", text or "").lower())
+        k = self.shingle_size
+        if len(tokens) < k:
+            return set(tokens)
+        return {" ".join(tokens[i:i + k]) for i in range(len(tokens) - k + 1)}
+
+    def signature(self, text: str) -> Signature:
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "little")
+            for s in self.shingles(text)
+        ]
+        if not hashes:
+            return (_MAX_HASH,) * self.num_perm
+        prime = _MERSENNE_PRIME
+        return tuple(
+            min((a * h + b) % prime for h in hashes) & _MAX_HASH
+            for a, b in self._perms
+        )
+
+    def signatures(self, texts: Sequence[str]) -> List[Signature]:
+        """Batch form so callers can compute signatures inside an executor"""
+        return [self.signature(text) for text in texts]
+
+def estimate_similarity(a: Signature, b: Signature) -> float:
+    """Estimated Jaccard similarity of the underlying shingle sets"""
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+class StoryCluster:
+    __slots__ = ("cluster_id", "members", "alternates")
+
+    def __init__(self, cluster_id: str):
+        self.cluster_id = cluster_id
+        self.members: List[str] = [cluster_id]
+        self.alternates: List[Dict[str, str]] = []
+
+    @property
+    def size(self) -> int:
+        return len(self.members)
+
+class StoryClusterer:
+    """LSH index assigning each article to a near-duplicate cluster
+
+    Signatures are split into `bands` bands; articles sharing any band bucket
+    are candidates and join the most similar candidate's cluster when the
+    estimated similarity reaches `threshold`. The first article of a cluster
+    stays its canonical article. Memory is bounded by `max_items`, evicting
+    the oldest articles first.
+    """
+
+    def __init__(self, threshold: float = 0.5, num_perm: int = 64, bands: int = 16,
+                 max_items: int = 5000, hasher: Optional[MinHasher] = None):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_items = max_items
+        self.hasher = hasher or MinHasher(num_perm=num_perm)
+        self._buckets: List[Dict[Signature, Set[str]]] = [{} for _ in range(bands)]
+        self._items: "OrderedDict[str, Tuple[Signature, str]]" = OrderedDict()
+        self.clusters: Dict[str, StoryCluster] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _bands(self, signature: Signature):
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, signature[band * rows:(band + 1) * rows]
+
+    def cluster_of(self, article_id: str) -> Optional[StoryCluster]:
+        item = self._items.get(article_id)
+        return self.clusters.get(item[1]) if item else None
+
+    def add(self, article_id: str, signature: Signature, source: Optional[str] = None,
+            url: Optional[str] = None) -> StoryCluster:
+        """Place an article in a cluster (idempotent for already-seen IDs)"""
+        existing = self.cluster_of(article_id)
+        if existing is not None:
+            return existing
+
+        candidates: Set[str] = set()
+        for band, key in self._bands(signature):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        best_id, best_score = None, self.threshold
+        for candidate in candidates:
+            score = estimate_similarity(signature, self._items[candidate][0])
+            if score >= best_score:
+                best_id, best_score = candidate, score
+
+        cluster = self.clusters.get(self._items[best_id][1]) if best_id else None
+        if cluster is None:
+            cluster = StoryCluster(article_id)
+            self.clusters[article_id] = cluster
+        elif article_id not in cluster.members:
+            cluster.members.append(article_id)
+            cluster.alternates.append({"id": article_id, "source": source or "Unknown", "url": url or ""})
+
+        self._items[article_id] = (signature, cluster.cluster_id)
+        for band, key in self._bands(signature):
+            self._buckets[band].setdefault(key, set()).add(article_id)
+
+        while len(self._items) > self.max_items:
+            self._evict_oldest()
+        return cluster
+
+    def _evict_oldest(self):
+        article_id, (signature, cluster_id) = self._items.popitem(last=False)
+        for band, key in self._bands(signature):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(article_id)
+                if not bucket:
+                    del self._buckets[band][key]
+        # Drop the cluster once none of its members is indexed any more
+        cluster = self.clusters.get(cluster_id)
+        if cluster is not None and not any(m in self._items for m in cluster.members):
+            del self.clusters[cluster_id]
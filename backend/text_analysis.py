@@ -0,0 +1,80 @@
+"""
+Keyword matching for article analysis
+One precompiled word-boundary regex finds every bias, sentiment and topic
+term in a single scan of the text.
+"""
+
+import re
+from typing import Dict, List, Sequence, Set, Tuple
+
+def _is_acronym(term: str) -> bool:
+    """UN, EU, G7... must match case-sensitively so "un" or "eu" never hit"""
+    return term.isupper() or (any(c.isdigit() for c in term) and any(c.isupper() for c in term))
+
+def _normalize(term: str) -> str:
+    return " ".join(term.split()).lower()
+
+def _trie_regex(terms: Sequence[str]) -> str:
+    """Compile terms into a prefix-trie alternation
+
+    Python's re engine tries alternatives one by one at every position, so
+    factoring shared prefixes keeps the per-character cost roughly flat as
+    the vocabulary grows.
+    """
+    trie: Dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[None] = True
+
+    def build(node: Dict) -> str:
+        branches = [
+            (r"\s+" if char == " " else re.escape(char)) + build(child)
+            for char, child in sorted((k, v) for k, v in node.items() if k is not None)
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if None in node else body
+
+    return build(trie)
+
+class KeywordMatcher:
+    """Multi-pattern matcher over named term categories
+
+    Terms match on whole words (with an optional plural "s"), so "UN" no
+    longer matches inside "under". The scan runs once over the lowercased
+    text; the rare acronym hit is then confirmed against the original casing.
+    """
+
+    def __init__(self, categories: Dict[str, Sequence[str]]):
+        self.categories = {name: list(terms) for name, terms in categories.items()}
+        self._lookup: Dict[str, List[Tuple[str, str]]] = {}
+        self._acronyms: Dict[str, "re.Pattern"] = {}
+        for name, terms in self.categories.items():
+            for term in terms:
+                self._lookup.setdefault(_normalize(term), []).append((name, term))
+                if _is_acronym(term):
+                    self._acronyms[term] = re.compile(rf"\b{re.escape(term)}s?\b")
+
+        self._pattern = re.compile(rf"\b{_trie_regex(sorted(self._lookup))}s?\b")
+
+    def scan(self, text: str) -> Dict[str, Set[str]]:
+        """Return the distinct terms found for each category"""
+        hits: Dict[str, Set[str]] = {name: set() for name in self.categories}
+        if not text:
+            return hits
+        lookup = self._lookup
+        acronyms = self._acronyms
+        for found in set(self._pattern.findall(text.lower())):
+            entries = lookup.get(found)
+            if entries is None:
+                if " " in found or "\n" in found or "\t" in found:
+                    found = _normalize(found)
+                entries = lookup.get(found) or lookup.get(found[:-1], ())
+            for name, term in entries:
+                if term in acronyms and not acronyms[term].search(text):
+                    continue
+                hits[name].add(term)
+        return hits
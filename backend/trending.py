@@ -0,0 +1,200 @@
+"""
+Streaming trending-topic detection
+Entity and topic mentions are counted in a time-decayed Count-Min Sketch,
+with a bounded heavy-hitter set for the leaders and per-window sketches to
+tell whether a topic is rising or falling. Memory is fixed by the sketch
+dimensions and candidate capacity, whatever the vocabulary size.
+"""
+
+import hashlib
+import heapq
+import math
+import re
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Runs of capitalised words ("European Union", "Joe Biden") and acronyms
+_ENTITY_RE = re.compile(r"\b(?:[A-Z][a-z]+(?:[ -](?:of |the |de )?[A-Z][a-z]+)+|[A-Z][A-Z0-9]+)\b")
+_CAPITALISED_RE = re.compile(r"(?<![.!?:]\s)(?<!^)\b[A-Z][a-z]{3,}\b")
+
+COMMON_CAPITALISED = frozenset("""
+the a an this that these those it its he she they we you our their his her
+breaking live update watch opinion analysis exclusive report news today
+monday tuesday wednesday thursday friday saturday sunday
+january february march april june july august september october november december
+""".split())
+
+def extract_entities(text: str) -> Set[str]:
+    """Named-entity-like phrases: capitalised runs, acronyms and mid-sentence proper nouns"""
+    found = set()
+    for match in _ENTITY_RE.findall(text or ""):
+        words = match.split()
+        while words and words[0].lower() in COMMON_CAPITALISED:
+            words = words[1:]
+        if words and (len(words) > 1 or words[0].isupper()):
+            found.add(" ".join(words))
+    for match in _CAPITALISED_RE.findall(text or ""):
+        if match.lower() not in COMMON_CAPITALISED and not any(match in e for e in found):
+            found.add(match)
+    return found
+
+class CountMinSketch:
+    """Fixed-size frequency sketch; estimates never undercount"""
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self._rows = [array("d", bytes(8 * width)) for _ in range(depth)]
+
+    def _indexes(self, key: str) -> Iterable[Tuple[array, int]]:
+        digest = hashlib.blake2b(key.encode(), digest_size=8 * self.depth).digest()
+        for i, row in enumerate(self._rows):
+            yield row, int.from_bytes(digest[8 * i:8 * i + 8], "little") % self.width
+
+    def add(self, key: str, weight: float = 1.0) -> float:
+        """Add `weight` to `key` and return its new estimate"""
+        estimate = math.inf
+        for row, index in self._indexes(key):
+            row[index] += weight
+            estimate = min(estimate, row[index])
+        return estimate
+
+    def estimate(self, key: str) -> float:
+        return min(row[index] for row, index in self._indexes(key))
+
+    def scale(self, factor: float):
+        for row in self._rows:
+            for i in range(self.width):
+                row[i] *= factor
+
+    def clear(self):
+        for row in self._rows:
+            for i in range(self.width):
+                row[i] = 0.0
+
+class TrendingTracker:
+    """Time-decayed heavy hitters with an up/down/neutral trend per term
+
+    Decay uses forward decay: a mention at time t is added with weight
+    2 ** ((t - t0) / half_life), so stored scores never need rewriting as
+    time passes; dividing by the weight of "now" gives the decayed count.
+    The `capacity` best-scoring terms are kept as candidates in a lazy
+    min-heap, so reading the top k touches only that bounded set.
+
+    Trend compares the term's count in the current `window` with the
+    previous window, prorated by how much of the current one has elapsed.
+    """
+
+    def __init__(self, half_life: float = 6 * 3600, window: float = 3600, capacity: int = 200,
+                 width: int = 2048, depth: int = 4, now: Optional[float] = None):
+        self.half_life = half_life
+        self.window = window
+        self.capacity = capacity
+        self._t0 = now or time.time()
+        self.decayed = CountMinSketch(width, depth)
+        self.current = CountMinSketch(width, depth)
+        self.previous = CountMinSketch(width, depth)
+        self._window_start = self._t0 - self._t0 % window
+        self._scores: Dict[str, float] = {}
+        self._names: Dict[str, str] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self.mentions = 0
+
+    def _weight(self, at: float) -> float:
+        return 2.0 ** ((at - self._t0) / self.half_life)
+
+    def _roll(self, now: float):
+        start = now - now % self.window
+        if start == self._window_start:
+            return
+        if start - self._window_start == self.window:
+            self.current, self.previous = self.previous, self.current
+        else:
+            self.previous.clear()
+        self.current.clear()
+        self._window_start = start
+        # Keep forward-decay weights well inside float range
+        if (now - self._t0) / self.half_life > 64:
+            factor = 1 / self._weight(now)
+            self.decayed.scale(factor)
+            self._scores = {key: score * factor for key, score in self._scores.items()}
+            self._heap = [(score, key) for key, score in self._scores.items()]
+            heapq.heapify(self._heap)
+            self._t0 = now
+
+    def _min_candidate(self) -> Tuple[float, str]:
+        heap = self._heap
+        while heap and self._scores.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0]
+
+    def add(self, term: str, at: Optional[float] = None, now: Optional[float] = None):
+        """Count one mention of `term` at time `at` (default now)"""
+        now = now or time.time()
+        at = min(at or now, now)
+        if now - at > self.half_life * 8:
+            return  # decayed to nothing
+        self._roll(now)
+        key = term.lower()
+        self.mentions += 1
+        score = self.decayed.add(key, self._weight(at))
+        if at >= self._window_start:
+            self.current.add(key)
+        elif at >= self._window_start - self.window:
+            self.previous.add(key)
+
+        if key not in self._scores and len(self._scores) >= self.capacity:
+            floor, weakest = self._min_candidate()
+            if score <= floor:
+                return
+            heapq.heappop(self._heap)
+            del self._scores[weakest]
+            self._names.pop(weakest, None)
+        self._scores[key] = score
+        self._names.setdefault(key, term)
+        heapq.heappush(self._heap, (score, key))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(s, k) for k, s in self._scores.items()]
+            heapq.heapify(self._heap)
+
+    def add_many(self, terms: Iterable[str], at: Optional[float] = None, now: Optional[float] = None):
+        for term in terms:
+            self.add(term, at=at, now=now)
+
+    def trend(self, key: str, now: float) -> str:
+        current = self.current.estimate(key)
+        previous = self.previous.estimate(key)
+        elapsed = max((now - self._window_start) / self.window, 0.25)
+        expected = previous * elapsed
+        if not previous:
+            return "up" if current else "neutral"
+        if current > expected * 1.25:
+            return "up"
+        if current < expected * 0.8:
+            return "down"
+        return "neutral"
+
+    def top(self, limit: int = 10, now: Optional[float] = None) -> List[Dict[str, object]]:
+        """Leading terms with their decayed mention count and trend"""
+        now = now or time.time()
+        self._roll(now)
+        scale = 1 / self._weight(now)
+        leaders = heapq.nlargest(limit, self._scores.items(), key=lambda item: item[1])
+        return [
+            {
+                "name": self._names.get(key, key),
+                "count": round(score * scale, 1),
+                "trend": self.trend(key, now),
+            }
+            for key, score in leaders
+        ]
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "mentions": self.mentions,
+            "candidates": len(self._scores),
+            "sketchCells": self.decayed.width * self.decayed.depth,
+            "halfLifeSeconds": self.half_life,
+            "windowSeconds": self.window,
+        }
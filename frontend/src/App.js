@@ -116,12 +116,14 @@ function App() {
 
   const handleRealtimeUpdate = (data) => {
     if (data.type === 'new_article') {
-      setNews(prev => [data.article, ...prev].slice(0, 50));
+      setNews(prev => [data.article, ...prev.filter(a => a.id !== data.article.id)].slice(0, 50));
       toast('New article received', {
         icon: '📰',
         duration: 3000,
       });
       updateStats([data.article, ...news]);
+    } else if (data.type === 'article_updated') {
+      setNews(prev => prev.map(a => (a.id === data.article.id ? data.article : a)));
     } else if (data.type === 'stats_update') {
       setStats(prev => ({ ...prev, ...data.stats }));
     }
@@ -6,6 +6,8 @@ const WS_URL = 'ws://localhost:8000/ws';  // Change to wss://your-render-url.onr
 let ws = null;
 let reconnectTimeout = null;
 let messageHandlers = [];
+// Last server cursor seen; sent back on reconnect to replay missed articles
+let lastCursor = null;
 
 export const connectWebSocket = (onMessage) => {
   if (ws && ws.readyState === WebSocket.OPEN) {
@@ -23,11 +25,23 @@ export const connectWebSocket = (onMessage) => {
       type: 'subscribe',
       channel: 'politics'
     }));
+
+    // Catch up on anything published while we were disconnected
+    if (lastCursor !== null) {
+      ws.send(JSON.stringify({
+        type: 'resume',
+        cursor: lastCursor
+      }));
+    }
   };
 
   ws.onmessage = (event) => {
     try {
       const data = JSON.parse(event.data);
+
+      if (typeof data.cursor === 'number' && (lastCursor === null || data.cursor > lastCursor)) {
+        lastCursor = data.cursor;
+      }
       
       // Call all registered message handlers
       messageHandlers.forEach(handler => handler(data));